@@ -33,6 +33,15 @@ config.set_main_option("sqlalchemy.url", str(settings.DATABASE_URL))
 # add your model's MetaData object here for 'autogenerate' support
 target_metadata = Base.metadata
 
+# Indexes created only when the server provides the extension they need
+# (see the add_cms_list_indexes migration); not declared on the models
+OPTIONAL_INDEXES = {"ix_content_title_trgm", "ix_content_excerpt_trgm"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Keep extension-dependent indexes out of autogenerate comparisons."""
+    return not (type_ == "index" and name in OPTIONAL_INDEXES)
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -55,6 +64,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -78,7 +88,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
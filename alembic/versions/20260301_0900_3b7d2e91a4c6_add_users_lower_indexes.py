@@ -0,0 +1,92 @@
+"""add_users_lower_indexes
+
+Revision ID: 3b7d2e91a4c6
+Revises: f9bbc875c702
+Create Date: 2026-03-01 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7d2e91a4c6"
+down_revision: Union[str, None] = "f9bbc875c702"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_LOWER_INDEXES = (
+    ("ix_users_email_lower", "email"),
+    ("ix_users_username_lower", "username"),
+)
+
+
+def _check_case_duplicates(column: str) -> None:
+    """Abort with the offending rows if ``column`` has case-variant duplicates."""
+    duplicates = op.get_bind().execute(
+        sa.text(
+            f"SELECT lower({column}) AS value, array_agg(id ORDER BY id) AS ids "
+            f"FROM users GROUP BY lower({column}) HAVING count(*) > 1 "
+            "ORDER BY 1"
+        )
+    ).all()
+    if duplicates:
+        listing = "\n".join(
+            f"  {row.value!r}: user ids {list(row.ids)}" for row in duplicates
+        )
+        raise RuntimeError(
+            f"Cannot create a case-insensitive unique index on users.{column}; "
+            f"these values differ only by case:\n{listing}\n"
+            "Merge or rename these users, then re-run the migration."
+        )
+
+
+def _drop_invalid_index(name: str) -> None:
+    """Drop an INVALID index left behind by an interrupted concurrent build."""
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name},
+    ).first()
+    if invalid:
+        op.drop_index(name, table_name="users", postgresql_concurrently=True)
+
+
+def upgrade() -> None:
+    # Fail with a readable list instead of a unique violation halfway through
+    for _, column in _LOWER_INDEXES:
+        _check_case_duplicates(column)
+
+    # Case-insensitive lookups for login/register; built concurrently so the
+    # users table stays writable while the index is created. A failed
+    # concurrent build leaves an INVALID index that would block a retry.
+    with op.get_context().autocommit_block():
+        for name, column in _LOWER_INDEXES:
+            _drop_invalid_index(name)
+            op.create_index(
+                name,
+                "users",
+                [sa.text(f"lower({column})")],
+                unique=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_username_lower",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_users_email_lower",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
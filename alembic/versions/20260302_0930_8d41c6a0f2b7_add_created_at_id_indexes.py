@@ -0,0 +1,51 @@
+"""add_created_at_id_indexes
+
+Revision ID: 8d41c6a0f2b7
+Revises: 3b7d2e91a4c6
+Create Date: 2026-03-02 09:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d41c6a0f2b7"
+down_revision: Union[str, None] = "3b7d2e91a4c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Back keyset pagination on (created_at, id) in the admin lists
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_created_at_id",
+            "users",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_content_created_at_id",
+            "content",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_content_created_at_id",
+            table_name="content",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_users_created_at_id",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,39 @@
+"""add_content_author_status_index
+
+Revision ID: 5e2a9c17d3f4
+Revises: 8d41c6a0f2b7
+Create Date: 2026-03-03 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e2a9c17d3f4"
+down_revision: Union[str, None] = "8d41c6a0f2b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves the per-author status counts on the editor dashboard
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_content_author_id_status",
+            "content",
+            ["author_id", "status"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_content_author_id_status",
+            table_name="content",
+            postgresql_concurrently=True,
+        )
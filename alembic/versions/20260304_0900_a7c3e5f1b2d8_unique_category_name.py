@@ -0,0 +1,77 @@
+"""unique_category_name
+
+Revision ID: a7c3e5f1b2d8
+Revises: 5e2a9c17d3f4
+Create Date: 2026-03-04 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c3e5f1b2d8"
+down_revision: Union[str, None] = "5e2a9c17d3f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _check_duplicate_names() -> None:
+    """Abort with the offending rows if category names are not unique."""
+    duplicates = op.get_bind().execute(
+        sa.text(
+            "SELECT name, array_agg(id ORDER BY id) AS ids FROM categories "
+            "GROUP BY name HAVING count(*) > 1 ORDER BY name"
+        )
+    ).all()
+    if duplicates:
+        listing = "\n".join(
+            f"  {row.name!r}: category ids {list(row.ids)}" for row in duplicates
+        )
+        raise RuntimeError(
+            "Cannot create a unique index on categories.name; these names are "
+            f"used more than once:\n{listing}\n"
+            "Rename or merge these categories, then re-run the migration."
+        )
+
+
+def _drop_invalid_index(name: str) -> None:
+    """Drop an INVALID index left behind by an interrupted concurrent build."""
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name},
+    ).first()
+    if invalid:
+        op.execute(sa.text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+
+
+def upgrade() -> None:
+    # Fail with a readable list instead of a unique violation halfway through
+    _check_duplicate_names()
+
+    # Arbiter index for INSERT ... ON CONFLICT (name) in create_category. A
+    # failed concurrent build leaves an INVALID index that would block a retry.
+    with op.get_context().autocommit_block():
+        _drop_invalid_index("ix_categories_name")
+        op.create_index(
+            op.f("ix_categories_name"),
+            "categories",
+            ["name"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_categories_name"),
+            table_name="categories",
+            postgresql_concurrently=True,
+        )
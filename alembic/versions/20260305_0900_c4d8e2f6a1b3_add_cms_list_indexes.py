@@ -0,0 +1,105 @@
+"""add_cms_list_indexes
+
+Revision ID: c4d8e2f6a1b3
+Revises: a7c3e5f1b2d8
+Create Date: 2026-03-05 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d8e2f6a1b3"
+down_revision: Union[str, None] = "a7c3e5f1b2d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Trigram indexes backing the ilike '%term%' title/excerpt searches
+TRGM_INDEXES = {
+    "ix_content_title_trgm": "title",
+    "ix_content_excerpt_trgm": "excerpt",
+}
+
+
+def _pg_trgm_available() -> bool:
+    return bool(
+        op.get_bind().scalar(
+            sa.text(
+                "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"
+            )
+        )
+    )
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Editor content list: WHERE author_id = ? ORDER BY created_at, id
+        op.create_index(
+            "ix_content_author_id_created_at_id",
+            "content",
+            ["author_id", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # Review and approved queues: WHERE status = ? ORDER BY updated_at, id
+        op.create_index(
+            "ix_content_status_updated_at_id",
+            "content",
+            ["status", "updated_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # Moderation list default view only shows comments that are not deleted
+        op.create_index(
+            "ix_comments_created_at_id_visible",
+            "comments",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+        )
+
+        # pg_trgm ships with the standard contrib package; skip the search
+        # indexes on servers that lack it rather than failing the upgrade
+        if _pg_trgm_available():
+            op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            for name, column in TRGM_INDEXES.items():
+                op.create_index(
+                    name,
+                    "content",
+                    [column],
+                    unique=False,
+                    postgresql_using="gin",
+                    postgresql_ops={column: "gin_trgm_ops"},
+                    postgresql_concurrently=True,
+                )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in TRGM_INDEXES:
+            op.drop_index(
+                name,
+                table_name="content",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+        op.drop_index(
+            "ix_comments_created_at_id_visible",
+            table_name="comments",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_content_status_updated_at_id",
+            table_name="content",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_content_author_id_created_at_id",
+            table_name="content",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,39 @@
+"""add_content_feed_index
+
+Revision ID: e1f7a3b9c5d2
+Revises: c4d8e2f6a1b3
+Create Date: 2026-03-06 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f7a3b9c5d2"
+down_revision: Union[str, None] = "c4d8e2f6a1b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Public feeds: WHERE status = ? AND type = ? ORDER BY published_at, id
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_content_status_type_published_at_id",
+            "content",
+            ["status", "type", "published_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_content_status_type_published_at_id",
+            table_name="content",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,54 @@
+"""add_category_feed_and_thread_indexes
+
+Revision ID: f3b8d1e6a4c7
+Revises: e1f7a3b9c5d2
+Create Date: 2026-03-07 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b8d1e6a4c7"
+down_revision: Union[str, None] = "e1f7a3b9c5d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Category feeds: WHERE category_id = ? AND status = ?
+        # ORDER BY published_at, id
+        op.create_index(
+            "ix_content_category_id_status_published_at_id",
+            "content",
+            ["category_id", "status", "published_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # Comment threads: WHERE content_id = ? AND parent_id IS NULL
+        # AND is_deleted = false ORDER BY created_at
+        op.create_index(
+            "ix_comments_content_id_parent_id_is_deleted_created_at",
+            "comments",
+            ["content_id", "parent_id", "is_deleted", "created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_comments_content_id_parent_id_is_deleted_created_at",
+            table_name="comments",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_content_category_id_status_published_at_id",
+            table_name="content",
+            postgresql_concurrently=True,
+        )
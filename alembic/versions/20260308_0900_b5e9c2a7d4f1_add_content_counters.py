@@ -0,0 +1,105 @@
+"""add_content_counters
+
+Revision ID: b5e9c2a7d4f1
+Revises: f3b8d1e6a4c7
+Create Date: 2026-03-08 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b5e9c2a7d4f1"
+down_revision: Union[str, None] = "f3b8d1e6a4c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "content",
+        sa.Column("likes_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "content",
+        sa.Column("comments_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Counters change with every like and comment write, in the same
+    # transaction, so reads never aggregate likes or comments
+    op.execute(
+        """
+        CREATE FUNCTION content_likes_count_trigger() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE content SET likes_count = likes_count + 1
+                WHERE id = NEW.content_id;
+            ELSE
+                UPDATE content SET likes_count = likes_count - 1
+                WHERE id = OLD.content_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER likes_count_trigger
+        AFTER INSERT OR DELETE ON likes
+        FOR EACH ROW EXECUTE FUNCTION content_likes_count_trigger()
+        """
+    )
+
+    # Only comments that are not soft-deleted are counted
+    op.execute(
+        """
+        CREATE FUNCTION content_comments_count_trigger() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND NOT OLD.is_deleted THEN
+                UPDATE content SET comments_count = comments_count - 1
+                WHERE id = OLD.content_id;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'INSERT') AND NOT NEW.is_deleted THEN
+                UPDATE content SET comments_count = comments_count + 1
+                WHERE id = NEW.content_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER comments_count_trigger
+        AFTER INSERT OR DELETE OR UPDATE OF is_deleted, content_id ON comments
+        FOR EACH ROW EXECUTE FUNCTION content_comments_count_trigger()
+        """
+    )
+
+    op.execute(
+        """
+        UPDATE content SET
+            likes_count = (
+                SELECT count(*) FROM likes WHERE likes.content_id = content.id
+            ),
+            comments_count = (
+                SELECT count(*) FROM comments
+                WHERE comments.content_id = content.id
+                AND comments.is_deleted = false
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER comments_count_trigger ON comments")
+    op.execute("DROP FUNCTION content_comments_count_trigger()")
+    op.execute("DROP TRIGGER likes_count_trigger ON likes")
+    op.execute("DROP FUNCTION content_likes_count_trigger()")
+    op.drop_column("content", "comments_count")
+    op.drop_column("content", "likes_count")
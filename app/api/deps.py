@@ -1,11 +1,16 @@
-from typing import Annotated, Generator
+import functools
+from datetime import datetime
+from typing import Annotated, Any, Generator
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 
-from app.core.security import decode_token
+from app.core.cache import cache_service
+from app.core.config import settings
+from app.core.security import decode_token_cached
 from app.db.base import get_db
 from app.models.user import User, UserRole
 
@@ -13,52 +18,141 @@ from app.models.user import User, UserRole
 security = HTTPBearer()
 security_optional = HTTPBearer(auto_error=False)
 
+# Column snapshots of authenticated users live in the shared cache backend,
+# so with Redis an invalidation reaches every worker. The local backend can
+# only invalidate its own worker, so it keeps snapshots for a short window.
+_USER_CACHE_TTL = (
+    settings.USER_CACHE_TTL
+    if settings.CACHE_TYPE == "redis"
+    else settings.USER_CACHE_LOCAL_TTL
+)
+# The password hash is never needed to resolve a user and is not cached
+_USER_COLUMNS = tuple(
+    attr.key for attr in inspect(User).column_attrs if attr.key != "hashed_password"
+)
 
-def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    db: Annotated[Session, Depends(get_db)],
+# Bit assigned to each role, used to build permission masks
+_ROLE_BITS = {role: 1 << index for index, role in enumerate(UserRole)}
+
+
+def _user_cache_key(user_id: int) -> str:
+    """Cache key for an authenticated user's column snapshot.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Cache key
+    """
+    return f"user:{user_id}:v1"
+
+
+def get_user_by_id(db: Session, user_id: int) -> User | None:
+    """Get user by ID, serving recently authenticated users from cache.
+
+    Cached users are attached to the session without issuing a query, so
+    they behave like regularly loaded instances (``hashed_password`` loads
+    on access if a caller needs it).
+
+    Args:
+        db: Database session
+        user_id: User ID
+
+    Returns:
+        User or None if not found
+    """
+    data: dict[str, Any] | None = cache_service.get_json(_user_cache_key(user_id))
+
+    if data is not None:
+        data["role"] = UserRole(data["role"])
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+        user = User(**data)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    user = db.get(User, user_id)
+    if user is not None:
+        cache_service.set_json(
+            _user_cache_key(user_id),
+            {key: getattr(user, key) for key in _USER_COLUMNS},
+            _USER_CACHE_TTL,
+        )
+    return user
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Drop a user from the authentication cache.
+
+    Must be called after changes to a user's role or status are committed.
+    With the Redis backend this applies to every worker; with the local one,
+    other workers pick up the change within ``USER_CACHE_LOCAL_TTL``.
+
+    Args:
+        user_id: User ID
+    """
+    cache_service.delete(_user_cache_key(user_id))
+
+
+def _resolve_user(
+    token: str, db: Session, credentials_exception: HTTPException
 ) -> User:
-    """Get current authenticated user from JWT token.
+    """Resolve the user referenced by an access token.
 
     Args:
-        credentials: HTTP bearer credentials
+        token: Encoded JWT access token
         db: Database session
+        credentials_exception: Exception raised when authentication fails
 
     Returns:
-        Current user
+        User referenced by the token (active or not)
 
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
     try:
-        token = credentials.credentials
-        payload = decode_token(token)
+        payload = decode_token_cached(token)
 
         # Check token type
         if payload.get("type") != "access":
             raise credentials_exception
 
-        user_id: int | None = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-
-    except JWTError:
+        user_id = int(payload["sub"])
+    except (JWTError, KeyError, TypeError, ValueError):
         raise credentials_exception
 
-    # Get user from database
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    # Get user from cache or database
+    user = get_user_by_id(db, user_id)
     if user is None:
         raise credentials_exception
 
     return user
 
 
+def get_current_user(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    db: Annotated[Session, Depends(get_db)],
+) -> User:
+    """Get current authenticated user from JWT token.
+
+    Args:
+        credentials: HTTP bearer credentials
+        db: Database session
+
+    Returns:
+        Current user
+
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    return _resolve_user(credentials.credentials, db, credentials_exception)
+
+
 def get_current_active_user(
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> User:
@@ -107,23 +201,8 @@ def get_current_user_from_cookie(
     if not token:
         raise credentials_exception
 
-    try:
-        payload = decode_token(token)
-
-        # Check token type
-        if payload.get("type") != "access":
-            raise credentials_exception
-
-        user_id: int | None = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-
-    except JWTError:
-        raise credentials_exception
-
-    # Get user from database
-    user = db.query(User).filter(User.id == int(user_id)).first()
-    if user is None or not user.is_active:
+    user = _resolve_user(token, db, credentials_exception)
+    if not user.is_active:
         raise credentials_exception
 
     return user
@@ -138,7 +217,8 @@ def get_current_user_unified(
 ) -> User:
     """Get current user from either Bearer token or Cookie.
 
-    Tries Bearer token first, then falls back to Cookie.
+    A Bearer token takes precedence over the cookie. If a token is provided
+    it must be valid; there is no fallback to the cookie.
 
     Args:
         request: FastAPI request
@@ -156,48 +236,43 @@ def get_current_user_unified(
         detail="Not authenticated",
     )
 
-    # 1. Try Bearer token
-    if token_creds:
-        try:
-            token = token_creds.credentials
-            payload = decode_token(token)
-
-            if payload.get("type") != "access":
-                raise credentials_exception
-
-            user_id: int | None = payload.get("sub")
-            if user_id is None:
-                raise credentials_exception
-
-            user = db.query(User).filter(User.id == int(user_id)).first()
-            if user and user.is_active:
-                return user
-
-        except (JWTError, ValueError):
-            # If token is invalid, don't fallback to cookie?
-            # Or should we? Usually if token is provided but invalid, we reject.
-            # But here let's be strict: if token provided, it must be valid.
-            raise credentials_exception
+    token = (
+        token_creds.credentials if token_creds else request.cookies.get("access_token")
+    )
+    if not token:
+        raise credentials_exception
 
-    # 2. Try Cookie
-    try:
-        return get_current_user_from_cookie(request, db)
-    except HTTPException:
-        pass
+    user = _resolve_user(token, db, credentials_exception)
+    if not user.is_active:
+        raise credentials_exception
 
-    # 3. Fail
-    raise credentials_exception
+    return user
 
 
 def require_role(*allowed_roles: UserRole):
     """Dependency factory for role-based access control.
 
+    Checkers are memoized per set of roles, so every call with the same roles
+    returns the same dependency and FastAPI can deduplicate it.
+
     Args:
         *allowed_roles: Roles that are allowed to access the endpoint
 
     Returns:
         Dependency function that checks user role
     """
+    return _require_role(frozenset(allowed_roles))
+
+
+@functools.cache
+def _require_role(allowed_roles: frozenset[UserRole]):
+    """Build the role checker for a set of roles (see ``require_role``)."""
+    allowed_mask = 0
+    for role in allowed_roles:
+        allowed_mask |= _ROLE_BITS[role]
+    forbidden_detail = "Insufficient permissions. Required roles: " + ", ".join(
+        role.value for role in UserRole if role in allowed_roles
+    )
 
     def role_checker(
         current_user: Annotated[User, Depends(get_current_user_unified)],
@@ -218,38 +293,44 @@ def require_role(*allowed_roles: UserRole):
                 status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user"
             )
 
-        if current_user.role not in allowed_roles:
+        if not _ROLE_BITS[current_user.role] & allowed_mask:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Insufficient permissions. Required roles: {', '.join(r.value for r in allowed_roles)}",
+                status_code=status.HTTP_403_FORBIDDEN, detail=forbidden_detail
             )
         return current_user
 
     return role_checker
 
 
-# Common role dependencies
+# Common role dependencies. Each role set maps to one memoized checker and
+# use_cache lets FastAPI run it once per request, however often it appears.
 RequireEditor = Depends(
     require_role(
         UserRole.EDITOR,
         UserRole.CHIEF_EDITOR,
         UserRole.PUBLISHING_EDITOR,
         UserRole.ADMIN,
-    )
+    ),
+    use_cache=True,
 )
 
-RequireChiefEditor = Depends(require_role(UserRole.CHIEF_EDITOR, UserRole.ADMIN))
+RequireChiefEditor = Depends(
+    require_role(UserRole.CHIEF_EDITOR, UserRole.ADMIN), use_cache=True
+)
 
 RequirePublishingEditor = Depends(
-    require_role(UserRole.PUBLISHING_EDITOR, UserRole.ADMIN)
+    require_role(UserRole.PUBLISHING_EDITOR, UserRole.ADMIN), use_cache=True
 )
 
-RequireModerator = Depends(require_role(UserRole.MODERATOR, UserRole.ADMIN))
+RequireModerator = Depends(
+    require_role(UserRole.MODERATOR, UserRole.ADMIN), use_cache=True
+)
 
-RequireAdmin = Depends(require_role(UserRole.ADMIN))
+RequireAdmin = Depends(require_role(UserRole.ADMIN), use_cache=True)
 
 RequirePublisherOrChief = Depends(
-    require_role(UserRole.PUBLISHING_EDITOR, UserRole.CHIEF_EDITOR, UserRole.ADMIN)
+    require_role(UserRole.PUBLISHING_EDITOR, UserRole.CHIEF_EDITOR, UserRole.ADMIN),
+    use_cache=True,
 )
 
 RequireCategoryManagement = Depends(
@@ -259,5 +340,6 @@ RequireCategoryManagement = Depends(
         UserRole.PUBLISHING_EDITOR,
         UserRole.MODERATOR,
         UserRole.ADMIN,
-    )
+    ),
+    use_cache=True,
 )
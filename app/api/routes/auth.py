@@ -1,20 +1,27 @@
 from typing import Annotated
 
+import anyio.to_thread
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from jose import JWTError
+from sqlalchemy import func, or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.api.deps import (
     get_current_active_user,
     get_current_user,
     get_current_user_from_cookie,
+    invalidate_cached_user,
 )
+from app.core.config import settings
 from app.core.security import (
     create_access_token,
     create_refresh_token,
-    decode_token,
+    decode_token_cached,
+    dummy_verify_password,
     get_password_hash,
-    verify_password,
+    run_password_hashing,
+    verify_and_update_password,
 )
 from app.db.base import get_db
 from app.models.user import User, UserRole
@@ -29,11 +36,72 @@ from app.schemas.user import (
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+# Auth cookie attributes, fixed for the lifetime of the process
+_COOKIE_KW = {
+    "httponly": True,
+    "secure": settings.COOKIE_SECURE,
+    "samesite": settings.COOKIE_SAMESITE,
+    "domain": settings.COOKIE_DOMAIN or None,
+}
+ACCESS_COOKIE_MAX_AGE = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+REFRESH_COOKIE_MAX_AGE = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+
+
+def _find_taken(db: Session, username: str, email: str) -> list:
+    """Find users holding a username or email and end the transaction.
+
+    Committing returns the connection to the pool before bcrypt runs.
+
+    Args:
+        db: Database session
+        username: Lower-cased username
+        email: Lower-cased email address
+
+    Returns:
+        Up to two ``(username, email)`` rows
+    """
+    # Case-insensitive, matching the lower() unique indexes
+    taken = db.execute(
+        select(User.username, User.email)
+        .where(
+            or_(
+                func.lower(User.username) == username,
+                func.lower(User.email) == email,
+            )
+        )
+        .limit(2)
+    ).all()
+    db.commit()
+    return taken
+
+
+def _insert_user(db: Session, user: User) -> None:
+    """Insert a new user, mapping a lost uniqueness race to a 400.
+
+    Args:
+        db: Database session
+        user: User to insert
+
+    Raises:
+        HTTPException: If username or email was registered concurrently
+    """
+    db.add(user)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username or email already registered",
+        )
+
 
 @router.post(
     "/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED
 )
-def register(user_data: UserCreate, db: Annotated[Session, Depends(get_db)]) -> User:
+async def register(
+    user_data: UserCreate, db: Annotated[Session, Depends(get_db)]
+) -> User:
     """Register a new user.
 
     Args:
@@ -46,45 +114,76 @@ def register(user_data: UserCreate, db: Annotated[Session, Depends(get_db)]) ->
     Raises:
         HTTPException: If username or email already exists
     """
-    # Check if username exists
-    if db.query(User).filter(User.username == user_data.username).first():
+    role = user_data.role or UserRole.USER
+    if role == UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already registered",
+            detail="Admin role cannot be assigned during registration",
         )
 
-    # Check if email exists
-    if db.query(User).filter(User.email == user_data.email).first():
+    # Same split as login: database work on the shared worker threads,
+    # bcrypt on its own limiter with no connection checked out
+    username = user_data.username.lower()
+    taken = await anyio.to_thread.run_sync(
+        _find_taken, db, username, user_data.email.lower()
+    )
+
+    if any(row.username.lower() == username for row in taken):
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username already registered",
         )
 
-    role = user_data.role or UserRole.USER
-    if role == UserRole.ADMIN:
+    if taken:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Admin role cannot be assigned during registration",
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
         )
 
-    # Create user
     user = User(
         username=user_data.username,
         email=user_data.email,
         first_name=user_data.first_name,
         last_name=user_data.last_name,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=await run_password_hashing(
+            get_password_hash, user_data.password
+        ),
         role=role,
     )
+    await anyio.to_thread.run_sync(_insert_user, db, user)
+
+    return user
 
-    db.add(user)
-    db.commit()
-    db.refresh(user)
 
+def _get_user_by_email(db: Session, email: str) -> User | None:
+    """Look up a user by email (case-insensitive) and end the transaction.
+
+    Committing returns the connection to the pool before bcrypt runs.
+
+    Args:
+        db: Database session
+        email: Email address
+
+    Returns:
+        User or None if not found
+    """
+    user = db.query(User).filter(func.lower(User.email) == email.lower()).first()
+    db.commit()
     return user
 
 
+def _save_user(db: Session, user: User) -> None:
+    """Commit changes to a user and drop its cached snapshot.
+
+    Args:
+        db: Database session
+        user: Modified user
+    """
+    db.commit()
+    invalidate_cached_user(user.id)
+
+
 @router.post("/login")
-def login(
+async def login(
     credentials: UserLogin, response: Response, db: Annotated[Session, Depends(get_db)]
 ):
     """Login user and return JWT tokens.
@@ -103,46 +202,52 @@ def login(
     Raises:
         HTTPException: If credentials are invalid
     """
-    # Find user by email
-    user = db.query(User).filter(User.email == credentials.email).first()
+    # Database work runs on the shared worker threads, bcrypt on its own
+    # limiter, so neither blocks the event loop
+    user = await anyio.to_thread.run_sync(_get_user_by_email, db, credentials.email)
 
-    if not user or not verify_password(credentials.password, user.hashed_password):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    invalid_credentials = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Incorrect email or password",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    if not user:
+        await run_password_hashing(dummy_verify_password)
+        raise invalid_credentials
+
+    valid, new_hash = await run_password_hashing(
+        verify_and_update_password, credentials.password, user.hashed_password
+    )
+    if not valid:
+        raise invalid_credentials
 
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="User account is inactive"
         )
 
+    if new_hash:
+        user.hashed_password = new_hash
+        await anyio.to_thread.run_sync(_save_user, db, user)
+
     # Create tokens
     access_token = create_access_token(data={"sub": str(user.id)})
     refresh_token = create_refresh_token(data={"sub": str(user.id)})
 
     # Set httpOnly cookies for CMS
-    from app.core.config import settings
-
     response.set_cookie(
         key="access_token",
         value=access_token,
-        httponly=True,
-        secure=settings.COOKIE_SECURE,
-        samesite=settings.COOKIE_SAMESITE,
-        max_age=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        domain=settings.COOKIE_DOMAIN or None,
+        max_age=ACCESS_COOKIE_MAX_AGE,
+        **_COOKIE_KW,
     )
 
     response.set_cookie(
         key="refresh_token",
         value=refresh_token,
-        httponly=True,
-        secure=settings.COOKIE_SECURE,
-        samesite=settings.COOKIE_SAMESITE,
-        max_age=settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
-        domain=settings.COOKIE_DOMAIN or None,
+        max_age=REFRESH_COOKIE_MAX_AGE,
+        **_COOKIE_KW,
     )
 
     # Return tokens in JSON for backward compatibility (public frontend)
@@ -185,7 +290,7 @@ def refresh_token(
     )
 
     try:
-        payload = decode_token(token_data.refresh_token)
+        payload = decode_token_cached(token_data.refresh_token)
 
         # Check token type
         if payload.get("type") != "refresh":
@@ -199,7 +304,7 @@ def refresh_token(
         raise credentials_exception
 
     # Verify user exists and is active
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user = db.get(User, int(user_id))
     if not user or not user.is_active:
         raise credentials_exception
 
@@ -1,21 +1,35 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy import delete
+from sqlalchemy.orm import Session, raiseload, selectinload
 
-from app.api.deps import RequireAdmin, get_db
+from app.api.deps import RequireAdmin, get_db, invalidate_cached_user
+from app.models.content import Content
 from app.models.user import User
+from app.schemas.content import ContentListItem
 from app.schemas.user import UserResponse, UserRoleUpdate, UserStatusUpdate
-from app.utils.pagination import paginate_query
+from app.utils.content import (
+    invalidate_content_cache,
+    invalidate_dashboards,
+    list_item_columns,
+)
+from app.utils.pagination import paginate_page
 
 router = APIRouter(prefix="/cms/admin", tags=["CMS - Administrator"])
 
+# Validate and dump whole pages in one call into pydantic-core
+_users_adapter = TypeAdapter(list[UserResponse])
+_content_items_adapter = TypeAdapter(list[ContentListItem])
+
 
 @router.get("/users", response_model=dict)
 def get_all_users(
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, RequireAdmin],
     skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     limit: int = Query(20, ge=1, le=100)
 ) -> dict:
     """Get all users.
@@ -23,23 +37,34 @@ def get_all_users(
     Args:
         db: Database session
         current_user: Current authenticated admin
-        skip: Number of items to skip
+        skip: Number of items to skip (deprecated, use cursor)
+        cursor: Cursor from the previous page's next_cursor
         limit: Maximum number of items to return
         
     Returns:
         Paginated list of users
     """
-    query = db.query(User).order_by(User.created_at.desc())
-    items, total = paginate_query(query, skip, limit)
+    query = db.query(User).options(raiseload("*"))
+    items, total, next_cursor = paginate_page(
+        query,
+        (User.created_at, User.id),
+        skip,
+        cursor,
+        limit,
+        descending=True,
+    )
     
     # Convert to UserResponse
-    user_responses = [UserResponse.model_validate(user) for user in items]
+    user_responses = _users_adapter.dump_python(
+        _users_adapter.validate_python(items, from_attributes=True), mode="json"
+    )
     
     return {
         "items": user_responses,
         "total": total,
         "skip": skip,
-        "limit": limit
+        "limit": limit,
+        "next_cursor": next_cursor
     }
 
 
@@ -62,7 +87,7 @@ def get_user(
     Raises:
         HTTPException: If user not found
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     
     if not user:
         raise HTTPException(
@@ -100,7 +125,7 @@ def update_user_role(
             detail="Cannot change your own role"
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     
     if not user:
         raise HTTPException(
@@ -110,6 +135,7 @@ def update_user_role(
     
     user.role = role_data.role
     db.commit()
+    invalidate_cached_user(user_id)
     
     return {"message": f"User role updated to {role_data.role.value}"}
 
@@ -141,7 +167,7 @@ def update_user_status(
             detail="Cannot change your own status"
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     
     if not user:
         raise HTTPException(
@@ -151,6 +177,7 @@ def update_user_status(
     
     user.is_active = status_data.is_active
     db.commit()
+    invalidate_cached_user(user_id)
     
     status_text = "activated" if status_data.is_active else "deactivated"
     return {"message": f"User {status_text} successfully"}
@@ -161,6 +188,7 @@ def get_all_content(
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, RequireAdmin],
     skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     limit: int = Query(20, ge=1, le=100)
 ) -> dict:
     """Get all content items (admin view).
@@ -168,26 +196,37 @@ def get_all_content(
     Args:
         db: Database session
         current_user: Current authenticated admin
-        skip: Number of items to skip
+        skip: Number of items to skip (deprecated, use cursor)
+        cursor: Cursor from the previous page's next_cursor
         limit: Maximum number of items to return
         
     Returns:
         Paginated list of content with minimal details
     """
-    from app.models.content import Content
-    from app.schemas.content import ContentListItem
-    
-    query = db.query(Content).order_by(Content.created_at.desc())
-    items, total = paginate_query(query, skip, limit)
+    # Load authors for the whole page in one query instead of one per row
+    query = db.query(Content).options(
+        list_item_columns, selectinload(Content.author), raiseload("*")
+    )
+    items, total, next_cursor = paginate_page(
+        query,
+        (Content.created_at, Content.id),
+        skip,
+        cursor,
+        limit,
+        descending=True,
+    )
     
-    # Convert to ContentListItem manually or via model_validate if schema matches
-    content_responses = [ContentListItem.model_validate(item) for item in items]
+    content_responses = _content_items_adapter.dump_python(
+        _content_items_adapter.validate_python(items, from_attributes=True),
+        mode="json",
+    )
     
     return {
         "items": content_responses,
         "total": total,
         "skip": skip,
-        "limit": limit
+        "limit": limit,
+        "next_cursor": next_cursor
     }
 
 
@@ -210,17 +249,21 @@ def delete_content(
     Raises:
         HTTPException: If content not found
     """
-    from app.models.content import Content
-    
-    content = db.query(Content).filter(Content.id == content_id).first()
+    # Dependent rows are removed by the ON DELETE CASCADE foreign keys
+    deleted = db.execute(
+        delete(Content)
+        .where(Content.id == content_id)
+        .returning(Content.author_id, Content.slug)
+    ).one_or_none()
     
-    if not content:
+    if deleted is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Content not found"
         )
     
-    db.delete(content)
     db.commit()
+    invalidate_dashboards(deleted.author_id)
+    invalidate_content_cache(deleted.slug)
     
     return {"message": "Content deleted successfully"}
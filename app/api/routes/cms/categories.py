@@ -1,12 +1,19 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, raiseload, selectinload
 
 from app.api.deps import RequireCategoryManagement, get_db
+from app.api.routes.public.content import invalidate_public_categories
+from app.core.cache import cache_service
+from app.core.config import settings
 from app.models.category import Category
 from app.models.user import User
+from app.utils.pagination import paginate_page
 from app.utils.slug import generate_unique_slug
 from app.schemas.category import (
     CategoryCreate,
@@ -17,12 +24,31 @@ from app.schemas.category import (
 
 router = APIRouter(prefix="/cms/categories", tags=["CMS - Categories"])
 
+CATEGORY_CACHE_PREFIX = "categories:cms:"
+
+# Invalidation reaches every worker only through Redis (see Settings)
+_CATEGORY_CACHE_TTL = (
+    settings.CATEGORY_CACHE_TTL
+    if settings.CACHE_TYPE == "redis"
+    else settings.CATEGORY_CACHE_LOCAL_TTL
+)
+
+# Validate and dump whole pages in one call into pydantic-core
+_categories_adapter = TypeAdapter(list[CategoryResponse])
+
+
+def invalidate_category_cache() -> None:
+    """Drop every cached category list page."""
+    cache_service.delete_prefix(CATEGORY_CACHE_PREFIX)
+    invalidate_public_categories()
+
 
 @router.get("", response_model=CategoryList)
 def get_categories(
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, RequireCategoryManagement],
     skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     limit: int = Query(100, ge=1, le=100),
 ) -> dict:
     """Get all categories.
@@ -30,24 +56,40 @@ def get_categories(
     Args:
         db: Database session
         current_user: Current authenticated editor (or higher)
-        skip: Number of items to skip
+        skip: Number of items to skip (deprecated, use cursor)
+        cursor: Cursor from the previous page's next_cursor
         limit: Maximum number of items to return
 
     Returns:
         List of categories and total count
     """
-    total = db.query(Category).count()
-    query = db.query(Category).order_by(Category.order.asc(), Category.name.asc())
-
-    if limit > 0:
-        query = query.offset(skip).limit(limit)
-
-    items = query.all()
-
-    # Pydantic v2 validation
-    category_responses = [CategoryResponse.model_validate(item) for item in items]
+    cache_key = f"{CATEGORY_CACHE_PREFIX}{skip}:{limit}:{cursor or ''}"
+    cached = cache_service.get_json(cache_key)
+    if cached is not None:
+        return cached
+
+    # The response nests children to any depth; load them one IN query per
+    # level, and let any other relationship access raise
+    items, total, next_cursor = paginate_page(
+        db.query(Category).options(
+            selectinload(Category.children, recursion_depth=-1), raiseload("*")
+        ),
+        (Category.order, Category.name, Category.id),
+        skip,
+        cursor,
+        limit,
+    )
 
-    return {"items": category_responses, "total": total}
+    page = {
+        "items": _categories_adapter.dump_python(
+            _categories_adapter.validate_python(items, from_attributes=True),
+            mode="json",
+        ),
+        "total": total,
+        "next_cursor": next_cursor,
+    }
+    cache_service.set_json(cache_key, page, _CATEGORY_CACHE_TTL)
+    return page
 
 
 @router.post("", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
@@ -66,31 +108,45 @@ def create_category(
     Returns:
         Created category
     """
-    # Check if name exists
-    if db.query(Category).filter(Category.name == category_data.name).first():
+    slug = generate_unique_slug(db, Category, category_data.name)
+
+    # Place after the last category if no order is given (computed in the INSERT)
+    order = category_data.order or (
+        select(func.coalesce(func.max(Category.order), 0) + 10).scalar_subquery()
+    )
+
+    # Insert unless the name is taken, atomically and in one statement. The
+    # slug was checked beforehand, so a concurrent create whose name slugifies
+    # the same way can still win the race and trip its unique index
+    try:
+        category = db.scalars(
+            pg_insert(Category)
+            .values(
+                name=category_data.name,
+                slug=slug,
+                description=category_data.description,
+                parent_id=category_data.parent_id,
+                order=order,
+            )
+            .on_conflict_do_nothing(index_elements=[Category.name])
+            .returning(Category)
+        ).one_or_none()
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Category with this name already exists",
+            detail="Category with this name or slug already exists",
         )
 
-    slug = generate_unique_slug(db, Category, category_data.name)
-
-    # Calculate order if not provided or 0
-    if category_data.order == 0:
-        max_order = db.query(func.max(Category.order)).scalar() or 0
-        category_data.order = max_order + 10
-
-    category = Category(
-        name=category_data.name,
-        slug=slug,
-        description=category_data.description,
-        parent_id=category_data.parent_id,
-        order=category_data.order,
-    )
+    if category is None:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Category with this name already exists",
+        )
 
-    db.add(category)
     db.commit()
-    db.refresh(category)
+    invalidate_category_cache()
 
     return category
 
@@ -111,7 +167,11 @@ def get_category(
     Returns:
         Category details
     """
-    category = db.query(Category).filter(Category.id == category_id).first()
+    category = db.get(
+        Category,
+        category_id,
+        options=[selectinload(Category.children, recursion_depth=-1), raiseload("*")],
+    )
 
     if not category:
         raise HTTPException(
@@ -139,7 +199,7 @@ def update_category(
     Returns:
         Updated category
     """
-    category = db.query(Category).filter(Category.id == category_id).first()
+    category = db.get(Category, category_id)
 
     if not category:
         raise HTTPException(
@@ -155,7 +215,15 @@ def update_category(
     for field, value in update_data.items():
         setattr(category, field, value)
 
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Category with this name or slug already exists",
+        )
+    invalidate_category_cache()
     db.refresh(category)
 
     return category
@@ -177,14 +245,17 @@ def delete_category(
     Returns:
         Success message
     """
-    category = db.query(Category).filter(Category.id == category_id).first()
+    # Subcategories cascade and content is detached by the foreign keys
+    deleted_id = db.execute(
+        delete(Category).where(Category.id == category_id).returning(Category.id)
+    ).scalar_one_or_none()
 
-    if not category:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Category not found"
         )
 
-    db.delete(category)
     db.commit()
+    invalidate_category_cache()
 
     return {"message": "Category deleted successfully"}
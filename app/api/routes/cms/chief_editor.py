@@ -1,20 +1,31 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
 from app.api.deps import RequireChiefEditor, get_db
+from app.core.cache import cache_service
+from app.core.config import settings
 from app.models.content import Content, ContentStatus
 from app.models.revision import Revision
 from app.models.user import User
 from app.schemas.content import (
     ContentList,
-    ContentListItem,
     ContentResponse,
     RevisionRequest,
 )
-from app.utils.pagination import paginate_query
+from app.utils.content import (
+    content_exists,
+    count_by_status,
+    invalidate_dashboards,
+    list_item_columns,
+    search_filter,
+    to_list_items,
+    transition_status,
+)
+from app.utils.db import get_or_404
+from app.utils.pagination import paginate_page
 
 router = APIRouter(prefix="/cms/chief-editor", tags=["CMS - Chief Editor"])
 
@@ -33,29 +44,27 @@ def get_chief_editor_dashboard(
     Returns:
         Dashboard statistics
     """
-    in_review_count = (
-        db.query(func.count(Content.id))
-        .filter(Content.status == ContentStatus.IN_REVIEW)
-        .scalar()
-    )
-
-    approved_count = (
-        db.query(func.count(Content.id))
-        .filter(Content.status == ContentStatus.APPROVED)
-        .scalar()
+    cache_key = "dashboard:chief"
+    cached = cache_service.get_json(cache_key)
+    if cached is not None:
+        return cached
+
+    counts = count_by_status(
+        db,
+        [
+            ContentStatus.IN_REVIEW,
+            ContentStatus.APPROVED,
+            ContentStatus.NEEDS_REVISION,
+        ],
     )
 
-    needs_revision_count = (
-        db.query(func.count(Content.id))
-        .filter(Content.status == ContentStatus.NEEDS_REVISION)
-        .scalar()
-    )
-
-    return {
-        "in_review": in_review_count,
-        "approved": approved_count,
-        "needs_revision": needs_revision_count,
+    dashboard = {
+        "in_review": counts[ContentStatus.IN_REVIEW],
+        "approved": counts[ContentStatus.APPROVED],
+        "needs_revision": counts[ContentStatus.NEEDS_REVISION],
     }
+    cache_service.set_json(cache_key, dashboard, settings.DASHBOARD_CACHE_TTL)
+    return dashboard
 
 
 @router.get("/review-queue", response_model=ContentList)
@@ -63,15 +72,17 @@ def get_review_queue(
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, RequireChiefEditor],
     skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     limit: int = Query(20, ge=1, le=100),
     search: str | None = Query(None),
-) -> dict:
+) -> Response:
     """Get content in review queue.
 
     Args:
         db: Database session
         current_user: Current authenticated chief editor
-        skip: Number of items to skip
+        skip: Number of items to skip (deprecated, use cursor)
+        cursor: Cursor from the previous page's next_cursor
         limit: Maximum number of items to return
         search: Optional text search
 
@@ -81,29 +92,26 @@ def get_review_queue(
     query = (
         db.query(Content)
         .filter(Content.status == ContentStatus.IN_REVIEW)
-        .options(joinedload(Content.author))
-        .order_by(Content.updated_at.asc())
+        .options(list_item_columns, selectinload(Content.author), raiseload("*"))
     )
 
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            (Content.title.ilike(search_term)) | (Content.excerpt.ilike(search_term))
-        )
+        query = query.filter(search_filter(search))
 
-    items, total = paginate_query(query, skip, limit)
+    items, total, next_cursor = paginate_page(
+        query, (Content.updated_at, Content.id), skip, cursor, limit
+    )
 
-    # Add computed fields
-    items_with_counts = []
-    for item in items:
-        item_dict = ContentListItem.model_validate(item).model_dump()
-        item_dict["likes_count"] = len(item.likes)
-        item_dict["comments_count"] = len(
-            [c for c in item.comments if not c.is_deleted]
-        )
-        items_with_counts.append(ContentListItem(**item_dict))
+    page = ContentList(
+        items=to_list_items(items),
+        total=total,
+        skip=skip,
+        limit=limit,
+        next_cursor=next_cursor,
+    )
 
-    return {"items": items_with_counts, "total": total, "skip": skip, "limit": limit}
+    # Serialize once in pydantic-core; a Response bypasses re-validation
+    return Response(page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/content/{content_id}", response_model=ContentResponse)
@@ -125,26 +133,15 @@ def get_content_for_review(
     Raises:
         HTTPException: If content not found
     """
-    content = (
-        db.query(Content)
-        .filter(Content.id == content_id)
-        .options(joinedload(Content.author))
-        .first()
-    )
-
-    if not content:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
-        )
-
-    # Add computed fields
-    content_dict = ContentResponse.model_validate(content).model_dump()
-    content_dict["likes_count"] = len(content.likes)
-    content_dict["comments_count"] = len(
-        [c for c in content.comments if not c.is_deleted]
+    content = get_or_404(
+        db,
+        select(Content)
+        .where(Content.id == content_id)
+        .options(joinedload(Content.author), raiseload("*")),
+        "Content not found",
     )
 
-    return ContentResponse(**content_dict)
+    return content
 
 
 @router.post("/content/{content_id}/approve")
@@ -166,20 +163,21 @@ def approve_content(
     Raises:
         HTTPException: If content not found or not in review
     """
-    content = db.query(Content).filter(Content.id == content_id).first()
-
-    if not content:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
-        )
+    author_id = transition_status(
+        db, content_id, [ContentStatus.IN_REVIEW], ContentStatus.APPROVED
+    )
 
-    if content.status != ContentStatus.IN_REVIEW:
+    if author_id is None:
+        if not content_exists(db, content_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Content is not in review"
         )
 
-    content.status = ContentStatus.APPROVED
     db.commit()
+    invalidate_dashboards(author_id)
 
     return {"message": "Content approved successfully"}
 
@@ -205,14 +203,16 @@ def request_revision(
     Raises:
         HTTPException: If content not found or not in review
     """
-    content = db.query(Content).filter(Content.id == content_id).first()
-
-    if not content:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
-        )
+    # Update content status
+    author_id = transition_status(
+        db, content_id, [ContentStatus.IN_REVIEW], ContentStatus.NEEDS_REVISION
+    )
 
-    if content.status != ContentStatus.IN_REVIEW:
+    if author_id is None:
+        if not content_exists(db, content_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Content is not in review"
         )
@@ -222,9 +222,7 @@ def request_revision(
         content_id=content_id, editor_id=current_user.id, comment=revision_data.comment
     )
     db.add(revision)
-
-    # Update content status
-    content.status = ContentStatus.NEEDS_REVISION
     db.commit()
+    invalidate_dashboards(author_id)
 
     return {"message": "Revision requested successfully"}
@@ -1,21 +1,34 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import delete, exists, select
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
 from app.api.deps import RequireEditor, get_db
+from app.core.cache import cache_service
+from app.core.config import settings
 from app.models.content import Content, ContentStatus
+from app.models.revision import Revision
 from app.models.user import User
 from app.schemas.content import (
     ContentCreate,
     ContentList,
-    ContentListItem,
     ContentResponse,
     ContentUpdate,
     RevisionResponse,
 )
-from app.utils.pagination import paginate_query
+from app.utils.content import (
+    content_exists,
+    count_by_status,
+    invalidate_content_cache,
+    invalidate_dashboards,
+    list_item_columns,
+    search_filter,
+    to_list_items,
+    transition_status,
+)
+from app.utils.db import get_or_404
+from app.utils.pagination import paginate_page
 from app.utils.slug import generate_unique_slug
 
 router = APIRouter(prefix="/cms/editor", tags=["CMS - Editor"])
@@ -35,47 +48,30 @@ def get_editor_dashboard(
     Returns:
         Dashboard statistics
     """
-    drafts_count = (
-        db.query(func.count(Content.id))
-        .filter(
-            Content.author_id == current_user.id, Content.status == ContentStatus.DRAFT
-        )
-        .scalar()
-    )
-
-    in_review_count = (
-        db.query(func.count(Content.id))
-        .filter(
-            Content.author_id == current_user.id,
-            Content.status == ContentStatus.IN_REVIEW,
-        )
-        .scalar()
-    )
-
-    needs_revision_count = (
-        db.query(func.count(Content.id))
-        .filter(
-            Content.author_id == current_user.id,
-            Content.status == ContentStatus.NEEDS_REVISION,
-        )
-        .scalar()
-    )
-
-    published_count = (
-        db.query(func.count(Content.id))
-        .filter(
-            Content.author_id == current_user.id,
-            Content.status == ContentStatus.PUBLISHED,
-        )
-        .scalar()
+    cache_key = f"dashboard:editor:{current_user.id}"
+    cached = cache_service.get_json(cache_key)
+    if cached is not None:
+        return cached
+
+    counts = count_by_status(
+        db,
+        [
+            ContentStatus.DRAFT,
+            ContentStatus.IN_REVIEW,
+            ContentStatus.NEEDS_REVISION,
+            ContentStatus.PUBLISHED,
+        ],
+        Content.author_id == current_user.id,
     )
 
-    return {
-        "drafts": drafts_count,
-        "in_review": in_review_count,
-        "needs_revision": needs_revision_count,
-        "published": published_count,
+    dashboard = {
+        "drafts": counts[ContentStatus.DRAFT],
+        "in_review": counts[ContentStatus.IN_REVIEW],
+        "needs_revision": counts[ContentStatus.NEEDS_REVISION],
+        "published": counts[ContentStatus.PUBLISHED],
     }
+    cache_service.set_json(cache_key, dashboard, settings.DASHBOARD_CACHE_TTL)
+    return dashboard
 
 
 @router.get("/content", response_model=ContentList)
@@ -83,16 +79,18 @@ def get_editor_content(
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, RequireEditor],
     skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     limit: int = Query(20, ge=1, le=100),
     status: ContentStatus | None = Query(None),
     search: str | None = Query(None),
-) -> dict:
+) -> Response:
     """Get editor's own content.
 
     Args:
         db: Database session
         current_user: Current authenticated editor
-        skip: Number of items to skip
+        skip: Number of items to skip (deprecated, use cursor)
+        cursor: Cursor from the previous page's next_cursor
         limit: Maximum number of items to return
         status: Optional status filter
         search: Optional text search (title/excerpt)
@@ -103,32 +101,35 @@ def get_editor_content(
     query = (
         db.query(Content)
         .filter(Content.author_id == current_user.id)
-        .options(joinedload(Content.author))
-        .order_by(Content.created_at.desc())
+        # The author is current_user, already in the identity map: no query
+        .options(list_item_columns, selectinload(Content.author), raiseload("*"))
     )
 
     if status:
         query = query.filter(Content.status == status)
 
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            (Content.title.ilike(search_term)) | (Content.excerpt.ilike(search_term))
-        )
-
-    items, total = paginate_query(query, skip, limit)
+        query = query.filter(search_filter(search))
+
+    items, total, next_cursor = paginate_page(
+        query,
+        (Content.created_at, Content.id),
+        skip,
+        cursor,
+        limit,
+        descending=True,
+    )
 
-    # Add computed fields
-    items_with_counts = []
-    for item in items:
-        item_dict = ContentListItem.model_validate(item).model_dump()
-        item_dict["likes_count"] = len(item.likes)
-        item_dict["comments_count"] = len(
-            [c for c in item.comments if not c.is_deleted]
-        )
-        items_with_counts.append(ContentListItem(**item_dict))
+    page = ContentList(
+        items=to_list_items(items),
+        total=total,
+        skip=skip,
+        limit=limit,
+        next_cursor=next_cursor,
+    )
 
-    return {"items": items_with_counts, "total": total, "skip": skip, "limit": limit}
+    # Serialize once in pydantic-core; a Response bypasses re-validation
+    return Response(page.model_dump_json(), media_type="application/json")
 
 
 @router.post(
@@ -168,13 +169,9 @@ def create_content(
     db.add(content)
     db.commit()
     db.refresh(content)
+    invalidate_dashboards(current_user.id)
 
-    # Add computed fields
-    content_dict = ContentResponse.model_validate(content).model_dump()
-    content_dict["likes_count"] = 0
-    content_dict["comments_count"] = 0
-
-    return ContentResponse(**content_dict)
+    return content
 
 
 @router.get("/content/{content_id}", response_model=ContentResponse)
@@ -196,26 +193,15 @@ def get_content(
     Raises:
         HTTPException: If content not found or not owned by editor
     """
-    content = (
-        db.query(Content)
-        .filter(Content.id == content_id, Content.author_id == current_user.id)
-        .options(joinedload(Content.author))
-        .first()
-    )
-
-    if not content:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
-        )
-
-    # Add computed fields
-    content_dict = ContentResponse.model_validate(content).model_dump()
-    content_dict["likes_count"] = len(content.likes)
-    content_dict["comments_count"] = len(
-        [c for c in content.comments if not c.is_deleted]
+    content = get_or_404(
+        db,
+        select(Content)
+        .where(Content.id == content_id, Content.author_id == current_user.id)
+        .options(joinedload(Content.author), raiseload("*")),
+        "Content not found",
     )
 
-    return ContentResponse(**content_dict)
+    return content
 
 
 @router.put("/content/{content_id}", response_model=ContentResponse)
@@ -239,17 +225,14 @@ def update_content(
     Raises:
         HTTPException: If content not found, not owned, or not editable
     """
-    content = (
-        db.query(Content)
-        .filter(Content.id == content_id, Content.author_id == current_user.id)
-        .first()
+    content = get_or_404(
+        db,
+        select(Content).where(
+            Content.id == content_id, Content.author_id == current_user.id
+        ),
+        "Content not found",
     )
 
-    if not content:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
-        )
-
     # Allow editing draft, needs_revision, approved, and published content
     if content.status in [ContentStatus.IN_REVIEW]:
         raise HTTPException(
@@ -257,6 +240,8 @@ def update_content(
             detail="Cannot edit content while it is in review",
         )
 
+    old_slug = content.slug
+
     # Update fields
     update_data = content_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
@@ -267,16 +252,10 @@ def update_content(
         content.slug = generate_unique_slug(db, Content, content_data.title)
 
     db.commit()
+    invalidate_content_cache(old_slug)
     db.refresh(content)
 
-    # Add computed fields
-    content_dict = ContentResponse.model_validate(content).model_dump()
-    content_dict["likes_count"] = len(content.likes)
-    content_dict["comments_count"] = len(
-        [c for c in content.comments if not c.is_deleted]
-    )
-
-    return ContentResponse(**content_dict)
+    return content
 
 
 @router.delete("/content/{content_id}")
@@ -298,26 +277,29 @@ def delete_content(
     Raises:
         HTTPException: If content not found, not owned, or not draft
     """
-    content = (
-        db.query(Content)
-        .filter(Content.id == content_id, Content.author_id == current_user.id)
-        .first()
-    )
-
-    if not content:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
+    # Can only delete drafts; dependent rows go with the ON DELETE CASCADE keys
+    deleted_id = db.execute(
+        delete(Content)
+        .where(
+            Content.id == content_id,
+            Content.author_id == current_user.id,
+            Content.status == ContentStatus.DRAFT,
         )
-
-    # Can only delete drafts
-    if content.status != ContentStatus.DRAFT:
+        .returning(Content.id)
+    ).scalar_one_or_none()
+
+    if deleted_id is None:
+        if not content_exists(db, content_id, Content.author_id == current_user.id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Can only delete draft content",
         )
 
-    db.delete(content)
     db.commit()
+    invalidate_dashboards(current_user.id)
 
     return {"message": "Content deleted successfully"}
 
@@ -341,26 +323,27 @@ def submit_for_review(
     Raises:
         HTTPException: If content not found, not owned, or not submittable
     """
-    content = (
-        db.query(Content)
-        .filter(Content.id == content_id, Content.author_id == current_user.id)
-        .first()
+    # Can submit draft or needs_revision content
+    author_id = transition_status(
+        db,
+        content_id,
+        [ContentStatus.DRAFT, ContentStatus.NEEDS_REVISION],
+        ContentStatus.IN_REVIEW,
+        Content.author_id == current_user.id,
     )
 
-    if not content:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
-        )
-
-    # Can submit draft or needs_revision content
-    if content.status not in [ContentStatus.DRAFT, ContentStatus.NEEDS_REVISION]:
+    if author_id is None:
+        if not content_exists(db, content_id, Content.author_id == current_user.id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Content is not in a submittable state",
         )
 
-    content.status = ContentStatus.IN_REVIEW
     db.commit()
+    invalidate_dashboards(current_user.id)
 
     return {"message": "Content submitted for review"}
 
@@ -384,15 +367,22 @@ def get_content_revisions(
     Raises:
         HTTPException: If content not found or not owned
     """
-    content = (
-        db.query(Content)
-        .filter(Content.id == content_id, Content.author_id == current_user.id)
-        .first()
+    owned = db.scalar(
+        select(
+            exists().where(
+                Content.id == content_id, Content.author_id == current_user.id
+            )
+        )
     )
 
-    if not content:
+    if not owned:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
         )
 
-    return content.revisions
+    return db.scalars(
+        select(Revision)
+        .where(Revision.content_id == content_id)
+        .order_by(Revision.id)
+        .options(raiseload("*"))
+    ).all()
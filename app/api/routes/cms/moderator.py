@@ -1,13 +1,14 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import update
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
-from app.api.deps import RequireModerator, get_db
+from app.api.deps import RequireModerator, get_db, invalidate_cached_user
 from app.models.comment import Comment
 from app.models.user import User
 from app.schemas.comment import CommentList, CommentResponse
-from app.utils.pagination import paginate_query
+from app.utils.pagination import paginate_page
 
 router = APIRouter(prefix="/cms/moderator", tags=["CMS - Moderator"])
 
@@ -17,34 +18,51 @@ def get_all_comments(
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, RequireModerator],
     skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     limit: int = Query(50, ge=1, le=100),
     include_deleted: bool = Query(False)
-) -> dict:
+) -> Response:
     """Get all comments for moderation.
     
     Args:
         db: Database session
         current_user: Current authenticated moderator
-        skip: Number of items to skip
+        skip: Number of items to skip (deprecated, use cursor)
+        cursor: Cursor from the previous page's next_cursor
         limit: Maximum number of items to return
         include_deleted: Include deleted comments
         
     Returns:
         Paginated list of comments
     """
+    # Replies nest to any depth and are serialized; they load with one IN
+    # query per level, and the relationships the response never reads raise
     query = db.query(Comment).options(
-        joinedload(Comment.user)
-    ).order_by(Comment.created_at.desc())
+        joinedload(Comment.user),
+        selectinload(Comment.replies, recursion_depth=-1).joinedload(Comment.user),
+        raiseload(Comment.content_item),
+        raiseload(Comment.parent)
+    )
     
     if not include_deleted:
         query = query.filter(Comment.is_deleted == False)
     
-    items, total = paginate_query(query, skip, limit)
-    
-    return {
-        "items": items,
-        "total": total
-    }
+    items, total, next_cursor = paginate_page(
+        query,
+        (Comment.created_at, Comment.id),
+        skip,
+        cursor,
+        limit,
+        descending=True,
+    )
+    
+    page = CommentList.model_validate(
+        {"items": items, "total": total, "next_cursor": next_cursor},
+        from_attributes=True
+    )
+    
+    # Serialize once in pydantic-core; a Response bypasses re-validation
+    return Response(page.model_dump_json(), media_type="application/json")
 
 
 @router.delete("/comments/{comment_id}")
@@ -66,15 +84,19 @@ def delete_comment(
     Raises:
         HTTPException: If comment not found
     """
-    comment = db.query(Comment).filter(Comment.id == comment_id).first()
-    
-    if not comment:
+    deleted_id = db.execute(
+        update(Comment)
+        .where(Comment.id == comment_id)
+        .values(is_deleted=True)
+        .returning(Comment.id)
+    ).scalar_one_or_none()
+    
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Comment not found"
         )
     
-    comment.is_deleted = True
     db.commit()
     
     return {"message": "Comment deleted successfully"}
@@ -105,16 +127,21 @@ def block_user(
             detail="Cannot block yourself"
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    updated_id = db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(is_active=False)
+        .returning(User.id)
+    ).scalar_one_or_none()
     
-    if not user:
+    if updated_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    user.is_active = False
     db.commit()
+    invalidate_cached_user(user_id)
     
     return {"message": "User blocked successfully"}
 
@@ -138,15 +165,20 @@ def unblock_user(
     Raises:
         HTTPException: If user not found
     """
-    user = db.query(User).filter(User.id == user_id).first()
-    
-    if not user:
+    updated_id = db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(is_active=True)
+        .returning(User.id)
+    ).scalar_one_or_none()
+    
+    if updated_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    user.is_active = True
     db.commit()
+    invalidate_cached_user(user_id)
     
     return {"message": "User unblocked successfully"}
@@ -1,24 +1,68 @@
 from datetime import datetime, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import Row, func, select, update
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
 from app.api.deps import RequirePublishingEditor, RequirePublisherOrChief, get_db
+from app.core.cache import cache_service
+from app.core.config import settings
 from app.models.content import Content, ContentStatus
 from app.models.user import User
 from app.schemas.content import (
     ContentList,
-    ContentListItem,
     ContentPublish,
     ContentResponse,
 )
-from app.utils.pagination import paginate_query
+from app.utils.content import (
+    content_exists,
+    invalidate_content_cache,
+    invalidate_dashboards,
+    list_item_columns,
+    search_filter,
+    to_list_items,
+)
+from app.utils.db import get_or_404
+from app.utils.pagination import paginate_page, paginate_query
 
 router = APIRouter(prefix="/cms/publishing", tags=["CMS - Publishing Editor"])
 
 
+def _update_approved(db: Session, content_id: int, **values) -> Row:
+    """Update approved content in a single ``UPDATE ... RETURNING``.
+
+    Args:
+        db: Database session
+        content_id: Content ID
+        **values: Column values to set
+
+    Returns:
+        Row with the content's ``author_id`` and ``slug``
+
+    Raises:
+        HTTPException: If content not found or not approved
+    """
+    updated = db.execute(
+        update(Content)
+        .where(Content.id == content_id, Content.status == ContentStatus.APPROVED)
+        .values(**values)
+        .returning(Content.author_id, Content.slug)
+    ).one_or_none()
+
+    if updated is None:
+        if not content_exists(db, content_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Content is not approved for publishing",
+        )
+
+    return updated
+
+
 @router.get("/dashboard")
 def get_publishing_dashboard(
     db: Annotated[Session, Depends(get_db)],
@@ -33,32 +77,33 @@ def get_publishing_dashboard(
     Returns:
         Dashboard statistics
     """
-    approved_count = (
-        db.query(func.count(Content.id))
-        .filter(Content.status == ContentStatus.APPROVED)
-        .scalar()
-    )
-
-    published_count = (
-        db.query(func.count(Content.id))
-        .filter(Content.status == ContentStatus.PUBLISHED)
-        .scalar()
-    )
-
-    scheduled_count = (
-        db.query(func.count(Content.id))
-        .filter(
-            Content.status == ContentStatus.APPROVED,
-            Content.scheduled_publish_at.isnot(None),
+    cache_key = "dashboard:publishing"
+    cached = cache_service.get_json(cache_key)
+    if cached is not None:
+        return cached
+
+    # One grouped scan; scheduled is the subset of approved with a publish time
+    rows = (
+        db.query(
+            Content.status,
+            func.count(Content.id),
+            func.count(Content.id).filter(Content.scheduled_publish_at.isnot(None)),
         )
-        .scalar()
+        .filter(Content.status.in_([ContentStatus.APPROVED, ContentStatus.PUBLISHED]))
+        .group_by(Content.status)
+        .all()
     )
+    counts = {row_status: (total, scheduled) for row_status, total, scheduled in rows}
+    approved_count, scheduled_count = counts.get(ContentStatus.APPROVED, (0, 0))
+    published_count, _ = counts.get(ContentStatus.PUBLISHED, (0, 0))
 
-    return {
+    dashboard = {
         "approved": approved_count,
         "published": published_count,
         "scheduled": scheduled_count,
     }
+    cache_service.set_json(cache_key, dashboard, settings.DASHBOARD_CACHE_TTL)
+    return dashboard
 
 
 @router.get("/approved-queue", response_model=ContentList)
@@ -66,14 +111,16 @@ def get_approved_queue(
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, RequirePublishingEditor],
     skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     limit: int = Query(20, ge=1, le=100),
-) -> dict:
+) -> Response:
     """Get approved content ready for publishing.
 
     Args:
         db: Database session
         current_user: Current authenticated publishing editor
-        skip: Number of items to skip
+        skip: Number of items to skip (deprecated, use cursor)
+        cursor: Cursor from the previous page's next_cursor
         limit: Maximum number of items to return
 
     Returns:
@@ -82,23 +129,23 @@ def get_approved_queue(
     query = (
         db.query(Content)
         .filter(Content.status == ContentStatus.APPROVED)
-        .options(joinedload(Content.author))
-        .order_by(Content.updated_at.asc())
+        .options(list_item_columns, selectinload(Content.author), raiseload("*"))
     )
 
-    items, total = paginate_query(query, skip, limit)
+    items, total, next_cursor = paginate_page(
+        query, (Content.updated_at, Content.id), skip, cursor, limit
+    )
 
-    # Add computed fields
-    items_with_counts = []
-    for item in items:
-        item_dict = ContentListItem.model_validate(item).model_dump()
-        item_dict["likes_count"] = len(item.likes)
-        item_dict["comments_count"] = len(
-            [c for c in item.comments if not c.is_deleted]
-        )
-        items_with_counts.append(ContentListItem(**item_dict))
+    page = ContentList(
+        items=to_list_items(items),
+        total=total,
+        skip=skip,
+        limit=limit,
+        next_cursor=next_cursor,
+    )
 
-    return {"items": items_with_counts, "total": total, "skip": skip, "limit": limit}
+    # Serialize once in pydantic-core; a Response bypasses re-validation
+    return Response(page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/published-content", response_model=ContentList)
@@ -108,7 +155,7 @@ def get_published_content(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     search: str | None = Query(None),
-) -> dict:
+) -> Response:
     """Get published content.
 
     Args:
@@ -124,29 +171,21 @@ def get_published_content(
     query = (
         db.query(Content)
         .filter(Content.status == ContentStatus.PUBLISHED)
-        .options(joinedload(Content.author))
+        .options(list_item_columns, selectinload(Content.author), raiseload("*"))
         .order_by(Content.is_pinned.desc(), Content.published_at.desc())
     )
 
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            (Content.title.ilike(search_term)) | (Content.excerpt.ilike(search_term))
-        )
+        query = query.filter(search_filter(search))
 
     items, total = paginate_query(query, skip, limit)
 
-    # Add computed fields
-    items_with_counts = []
-    for item in items:
-        item_dict = ContentListItem.model_validate(item).model_dump()
-        item_dict["likes_count"] = len(item.likes)
-        item_dict["comments_count"] = len(
-            [c for c in item.comments if not c.is_deleted]
-        )
-        items_with_counts.append(ContentListItem(**item_dict))
+    page = ContentList(
+        items=to_list_items(items), total=total, skip=skip, limit=limit
+    )
 
-    return {"items": items_with_counts, "total": total, "skip": skip, "limit": limit}
+    # Serialize once in pydantic-core; a Response bypasses re-validation
+    return Response(page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/content/{content_id}", response_model=ContentResponse)
@@ -168,18 +207,14 @@ def get_publishing_content(
     Raises:
         HTTPException: If content not found
     """
-    content = (
-        db.query(Content)
-        .filter(Content.id == content_id)
-        .options(joinedload(Content.author))
-        .first()
+    content = get_or_404(
+        db,
+        select(Content)
+        .where(Content.id == content_id)
+        .options(joinedload(Content.author), raiseload("*")),
+        "Content not found",
     )
 
-    if not content:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
-        )
-
     # Allow viewing if approved OR published
     if content.status not in [ContentStatus.APPROVED, ContentStatus.PUBLISHED]:
         raise HTTPException(
@@ -187,14 +222,7 @@ def get_publishing_content(
             detail="Content is not accessible for publishing editor",
         )
 
-    # Add computed fields
-    content_dict = ContentResponse.model_validate(content).model_dump()
-    content_dict["likes_count"] = len(content.likes)
-    content_dict["comments_count"] = len(
-        [c for c in content.comments if not c.is_deleted]
-    )
-
-    return ContentResponse(**content_dict)
+    return content
 
 
 @router.post("/content/{content_id}/publish")
@@ -218,29 +246,25 @@ def publish_content(
     Raises:
         HTTPException: If content not found or not approved
     """
-    content = db.query(Content).filter(Content.id == content_id).first()
-
-    if not content:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
-        )
-
-    if content.status != ContentStatus.APPROVED:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Content is not approved for publishing",
-        )
-
     # Check if scheduling
     if publish_data and publish_data.scheduled_publish_at:
-        content.scheduled_publish_at = publish_data.scheduled_publish_at
+        updated = _update_approved(
+            db, content_id, scheduled_publish_at=publish_data.scheduled_publish_at
+        )
         db.commit()
+        invalidate_dashboards(updated.author_id)
         return {"message": "Content scheduled for publishing"}
 
     # Publish immediately
-    content.status = ContentStatus.PUBLISHED
-    content.published_at = datetime.now(timezone.utc)
+    updated = _update_approved(
+        db,
+        content_id,
+        status=ContentStatus.PUBLISHED,
+        published_at=datetime.now(timezone.utc),
+    )
     db.commit()
+    invalidate_dashboards(updated.author_id)
+    invalidate_content_cache(updated.slug)
 
     return {"message": "Content published successfully"}
 
@@ -272,21 +296,11 @@ def schedule_content(
             detail="Scheduled publish time is required",
         )
 
-    content = db.query(Content).filter(Content.id == content_id).first()
-
-    if not content:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
-        )
-
-    if content.status != ContentStatus.APPROVED:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Content is not approved for publishing",
-        )
-
-    content.scheduled_publish_at = publish_data.scheduled_publish_at
+    updated = _update_approved(
+        db, content_id, scheduled_publish_at=publish_data.scheduled_publish_at
+    )
     db.commit()
+    invalidate_dashboards(updated.author_id)
 
     return {"message": "Content scheduled successfully"}
 
@@ -310,20 +324,25 @@ def unpublish_content(
     Raises:
         HTTPException: If content not found or not published
     """
-    content = db.query(Content).filter(Content.id == content_id).first()
-
-    if not content:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
-        )
-
-    if content.status != ContentStatus.PUBLISHED:
+    updated = db.execute(
+        update(Content)
+        .where(Content.id == content_id, Content.status == ContentStatus.PUBLISHED)
+        .values(status=ContentStatus.APPROVED)
+        .returning(Content.author_id, Content.slug)
+    ).one_or_none()
+
+    if updated is None:
+        if not content_exists(db, content_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Content is not published"
         )
 
-    content.status = ContentStatus.APPROVED
     db.commit()
+    invalidate_dashboards(updated.author_id)
+    invalidate_content_cache(updated.slug)
 
     return {"message": "Content unpublished successfully"}
 
@@ -347,15 +366,20 @@ def pin_content(
     Raises:
         HTTPException: If content not found
     """
-    content = db.query(Content).filter(Content.id == content_id).first()
-
-    if not content:
+    slug = db.execute(
+        update(Content)
+        .where(Content.id == content_id)
+        .values(is_pinned=True)
+        .returning(Content.slug)
+    ).scalar_one_or_none()
+
+    if slug is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
         )
 
-    content.is_pinned = True
     db.commit()
+    invalidate_content_cache(slug)
 
     return {"message": "Content pinned successfully"}
 
@@ -379,14 +403,19 @@ def unpin_content(
     Raises:
         HTTPException: If content not found
     """
-    content = db.query(Content).filter(Content.id == content_id).first()
-
-    if not content:
+    slug = db.execute(
+        update(Content)
+        .where(Content.id == content_id)
+        .values(is_pinned=False)
+        .returning(Content.slug)
+    ).scalar_one_or_none()
+
+    if slug is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
         )
 
-    content.is_pinned = False
     db.commit()
+    invalidate_content_cache(slug)
 
     return {"message": "Content unpinned successfully"}
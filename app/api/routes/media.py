@@ -1,5 +1,6 @@
 from typing import Annotated
 
+import anyio.to_thread
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
@@ -22,7 +23,7 @@ async def upload_media(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
-) -> dict:
+) -> MediaUploadResponse:
     """Upload media file.
 
     Args:
@@ -48,27 +49,21 @@ async def upload_media(
         uploaded_by=current_user.id,
     )
 
+    # id comes back from the INSERT and created_at is set client-side, and
+    # sessions do not expire on commit, so no refresh SELECT is needed. This
+    # route is async, so the blocking commit runs on the threadpool
     db.add(media)
-    db.commit()
-    db.refresh(media)
+    await anyio.to_thread.run_sync(db.commit)
 
     # For S3 keep the absolute URL, for local keep the static media route.
+    # url is not a column; set it on the instance so the response validates
+    # straight from attributes
     if settings.STORAGE_TYPE == "s3":
-        url = file_path
+        media.url = file_path
     else:
-        url = f"/media/{filename}"
+        media.url = f"/media/{filename}"
 
-    # Manually construct response with all fields
-    return {
-        "id": media.id,
-        "filename": media.filename,
-        "file_path": media.file_path,
-        "file_type": media.file_type,
-        "file_size": media.file_size,
-        "uploaded_by": media.uploaded_by,
-        "created_at": media.created_at,
-        "url": url,
-    }
+    return MediaUploadResponse.model_validate(media)
 
 
 # Media serving is handled by StaticFiles in main.py
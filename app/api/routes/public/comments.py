@@ -1,7 +1,8 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
 from app.api.deps import get_current_active_user
 from app.db.base import get_db
@@ -9,6 +10,7 @@ from app.models.comment import Comment
 from app.models.content import Content, ContentStatus
 from app.models.user import User
 from app.schemas.comment import CommentCreate, CommentList, CommentResponse
+from app.utils.content import content_exists
 from app.utils.pagination import paginate_query
 
 router = APIRouter(prefix="/public", tags=["Public Comments"])
@@ -20,7 +22,7 @@ def get_content_comments(
     db: Annotated[Session, Depends(get_db)],
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100)
-) -> dict:
+) -> Response:
     """Get comments for published content.
     
     Args:
@@ -36,12 +38,7 @@ def get_content_comments(
         HTTPException: If content not found or not published
     """
     # Verify content exists and is published
-    content = db.query(Content).filter(
-        Content.id == content_id,
-        Content.status == ContentStatus.PUBLISHED
-    ).first()
-    
-    if not content:
+    if not content_exists(db, content_id, Content.status == ContentStatus.PUBLISHED):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Content not found"
@@ -54,15 +51,23 @@ def get_content_comments(
         Comment.is_deleted == False
     ).options(
         joinedload(Comment.user),
-        joinedload(Comment.replies)
+        # One IN query per reply level instead of a parent x replies join;
+        # deleted replies are filtered out in SQL at every level
+        selectinload(
+            Comment.replies.and_(Comment.is_deleted == False), recursion_depth=-1
+        ).joinedload(Comment.user),
+        raiseload("*")
     ).order_by(Comment.created_at.desc())
     
     items, total = paginate_query(query, skip, limit)
     
-    return {
-        "items": items,
-        "total": total
-    }
+    page = CommentList.model_validate(
+        {"items": items, "total": total},
+        from_attributes=True
+    )
+    
+    # Serialize once in pydantic-core; a Response bypasses re-validation
+    return Response(page.model_dump_json(), media_type="application/json")
 
 
 @router.post("/content/{content_id}/comments", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
@@ -87,12 +92,7 @@ def create_comment(
         HTTPException: If content not found or not published
     """
     # Verify content exists and is published
-    content = db.query(Content).filter(
-        Content.id == content_id,
-        Content.status == ContentStatus.PUBLISHED
-    ).first()
-    
-    if not content:
+    if not content_exists(db, content_id, Content.status == ContentStatus.PUBLISHED):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Content not found"
@@ -134,13 +134,15 @@ def reply_to_comment(
     Raises:
         HTTPException: If parent comment not found
     """
-    # Verify parent comment exists
-    parent_comment = db.query(Comment).filter(
-        Comment.id == comment_id,
-        Comment.is_deleted == False
-    ).first()
+    # Verify parent comment exists; only its content ID is needed
+    parent_content_id = db.scalar(
+        select(Comment.content_id).where(
+            Comment.id == comment_id,
+            Comment.is_deleted == False
+        )
+    )
     
-    if not parent_comment:
+    if parent_content_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Comment not found"
@@ -150,7 +152,7 @@ def reply_to_comment(
     reply = Comment(
         content=reply_data.content,
         user_id=current_user.id,
-        content_id=parent_comment.content_id,
+        content_id=parent_content_id,
         parent_id=comment_id
     )
     
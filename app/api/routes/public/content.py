@@ -1,31 +1,60 @@
+import hashlib
+import threading
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session, joinedload
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
+from app.core.cache import cache_service
+from app.core.config import settings
+from app.core.view_counter import view_counter
 from app.db.base import get_db
 from app.models.content import Content, ContentStatus, ContentType
 from app.models.category import Category
-from app.schemas.content import ContentList, ContentListItem, ContentResponse
+from app.schemas.content import ContentList, ContentResponse
 from app.schemas.category import CategoryList
-from app.utils.pagination import paginate_query
+from app.utils.content import (
+    content_cache_key,
+    list_item_columns,
+    search_filter,
+    to_list_items,
+)
+from app.utils.db import get_or_404
+from app.utils.pagination import paginate_page
 
 router = APIRouter(prefix="/public", tags=["Public Content"])
 
+# Serialized category lists, keyed by has_content
+_categories_cache: TTLCache = TTLCache(
+    maxsize=2, ttl=settings.PUBLIC_CATEGORIES_CACHE_TTL
+)
+_categories_cache_lock = threading.Lock()
+
+
+def invalidate_public_categories() -> None:
+    """Drop this worker's cached public category lists."""
+    with _categories_cache_lock:
+        _categories_cache.clear()
+
 
 @router.get("/news", response_model=ContentList)
 def get_published_news(
     db: Annotated[Session, Depends(get_db)],
     skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     limit: int = Query(20, ge=1, le=100),
     category_id: int | None = Query(None),
     search: str | None = Query(None),
-) -> dict:
+) -> Response:
     """Get list of published news.
 
     Args:
         db: Database session
-        skip: Number of items to skip
+        skip: Number of items to skip (deprecated, use cursor)
+        cursor: Cursor from the previous page's next_cursor
         limit: Maximum number of items to return
         category_id: Optional category filter
         search: Optional search term
@@ -38,48 +67,51 @@ def get_published_news(
         .filter(
             Content.type == ContentType.NEWS, Content.status == ContentStatus.PUBLISHED
         )
-        .options(joinedload(Content.author))
-        .order_by(Content.published_at.desc())
+        .options(list_item_columns, joinedload(Content.author), raiseload("*"))
     )
 
     if category_id:
         query = query.filter(Content.category_id == category_id)
 
     if search:
-        search_filter = f"%{search}%"
-        query = query.filter(
-            (Content.title.ilike(search_filter))
-            | (Content.excerpt.ilike(search_filter))
-        )
-
-    items, total = paginate_query(query, skip, limit)
+        query = query.filter(search_filter(search))
+
+    items, total, next_cursor = paginate_page(
+        query,
+        (Content.published_at, Content.id),
+        skip,
+        cursor,
+        limit,
+        descending=True,
+    )
 
-    # Add computed fields
-    items_with_counts = []
-    for item in items:
-        item_dict = ContentListItem.model_validate(item).model_dump()
-        item_dict["likes_count"] = len(item.likes)
-        item_dict["comments_count"] = len(
-            [c for c in item.comments if not c.is_deleted]
-        )
-        items_with_counts.append(ContentListItem(**item_dict))
+    page = ContentList(
+        items=to_list_items(items),
+        total=total,
+        skip=skip,
+        limit=limit,
+        next_cursor=next_cursor,
+    )
 
-    return {"items": items_with_counts, "total": total, "skip": skip, "limit": limit}
+    # Serialize once in pydantic-core; a Response bypasses re-validation
+    return Response(page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/articles", response_model=ContentList)
 def get_published_articles(
     db: Annotated[Session, Depends(get_db)],
     skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     limit: int = Query(20, ge=1, le=100),
     category_id: int | None = Query(None),
     search: str | None = Query(None),
-) -> dict:
+) -> Response:
     """Get list of published articles.
 
     Args:
         db: Database session
-        skip: Number of items to skip
+        skip: Number of items to skip (deprecated, use cursor)
+        cursor: Cursor from the previous page's next_cursor
         limit: Maximum number of items to return
         category_id: Optional category filter
         search: Optional search term
@@ -93,33 +125,34 @@ def get_published_articles(
             Content.type == ContentType.ARTICLE,
             Content.status == ContentStatus.PUBLISHED,
         )
-        .options(joinedload(Content.author))
-        .order_by(Content.published_at.desc())
+        .options(list_item_columns, joinedload(Content.author), raiseload("*"))
     )
 
     if category_id:
         query = query.filter(Content.category_id == category_id)
 
     if search:
-        search_filter = f"%{search}%"
-        query = query.filter(
-            (Content.title.ilike(search_filter))
-            | (Content.excerpt.ilike(search_filter))
-        )
-
-    items, total = paginate_query(query, skip, limit)
+        query = query.filter(search_filter(search))
+
+    items, total, next_cursor = paginate_page(
+        query,
+        (Content.published_at, Content.id),
+        skip,
+        cursor,
+        limit,
+        descending=True,
+    )
 
-    # Add computed fields
-    items_with_counts = []
-    for item in items:
-        item_dict = ContentListItem.model_validate(item).model_dump()
-        item_dict["likes_count"] = len(item.likes)
-        item_dict["comments_count"] = len(
-            [c for c in item.comments if not c.is_deleted]
-        )
-        items_with_counts.append(ContentListItem(**item_dict))
+    page = ContentList(
+        items=to_list_items(items),
+        total=total,
+        skip=skip,
+        limit=limit,
+        next_cursor=next_cursor,
+    )
 
-    return {"items": items_with_counts, "total": total, "skip": skip, "limit": limit}
+    # Serialize once in pydantic-core; a Response bypasses re-validation
+    return Response(page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/search", response_model=ContentList)
@@ -127,48 +160,50 @@ def search_content(
     db: Annotated[Session, Depends(get_db)],
     q: str = Query(..., min_length=1),
     skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     limit: int = Query(20, ge=1, le=100),
-) -> dict:
+) -> Response:
     """Search across all published content.
 
     Args:
         db: Database session
         q: Search query
-        skip: Number of items to skip
+        skip: Number of items to skip (deprecated, use cursor)
+        cursor: Cursor from the previous page's next_cursor
         limit: Maximum number of items to return
 
     Returns:
         Paginated list of search results
     """
-    search_filter = f"%{q}%"
     query = (
         db.query(Content)
-        .filter(
-            Content.status == ContentStatus.PUBLISHED,
-            (Content.title.ilike(search_filter))
-            | (Content.excerpt.ilike(search_filter)),
-        )
-        .options(joinedload(Content.author))
-        .order_by(Content.published_at.desc())
+        .filter(Content.status == ContentStatus.PUBLISHED, search_filter(q))
+        .options(list_item_columns, joinedload(Content.author), raiseload("*"))
     )
 
-    items, total = paginate_query(query, skip, limit)
+    items, total, next_cursor = paginate_page(
+        query,
+        (Content.published_at, Content.id),
+        skip,
+        cursor,
+        limit,
+        descending=True,
+    )
 
-    # Add computed fields
-    items_with_counts = []
-    for item in items:
-        item_dict = ContentListItem.model_validate(item).model_dump()
-        item_dict["likes_count"] = len(item.likes)
-        item_dict["comments_count"] = len(
-            [c for c in item.comments if not c.is_deleted]
-        )
-        items_with_counts.append(ContentListItem(**item_dict))
+    page = ContentList(
+        items=to_list_items(items),
+        total=total,
+        skip=skip,
+        limit=limit,
+        next_cursor=next_cursor,
+    )
 
-    return {"items": items_with_counts, "total": total, "skip": skip, "limit": limit}
+    # Serialize once in pydantic-core; a Response bypasses re-validation
+    return Response(page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/content/{slug}", response_model=ContentResponse)
-def get_content_by_slug(slug: str, db: Annotated[Session, Depends(get_db)]) -> Content:
+def get_content_by_slug(slug: str, db: Annotated[Session, Depends(get_db)]) -> Response:
     """Get published content by slug.
 
     Args:
@@ -181,58 +216,114 @@ def get_content_by_slug(slug: str, db: Annotated[Session, Depends(get_db)]) -> C
     Raises:
         HTTPException: If content not found or not published
     """
-    content = (
-        db.query(Content)
-        .filter(Content.slug == slug, Content.status == ContentStatus.PUBLISHED)
-        .options(joinedload(Content.author))
-        .first()
+    cache_key = content_cache_key(slug)
+    content_dict = cache_service.get_json(cache_key)
+
+    if content_dict is None:
+        content = get_or_404(
+            db,
+            select(Content)
+            .where(Content.slug == slug, Content.status == ContentStatus.PUBLISHED)
+            .options(joinedload(Content.author), raiseload("*")),
+            "Content not found",
+        )
+
+        content_dict = ContentResponse.model_validate(content).model_dump(mode="json")
+        cache_service.set_json(cache_key, content_dict, settings.CONTENT_CACHE_TTL)
+
+    # Increment view count; buffered and written in batches off the request
+    view_counter.increment(content_dict["id"])
+    content_dict["view_count"] += 1  # include this view
+
+    return Response(orjson.dumps(content_dict), media_type="application/json")
+
+
+def _load_categories(db: Session, has_content: bool) -> tuple[bytes, str]:
+    """Query and serialize the public category list.
+
+    Args:
+        db: Database session
+        has_content: If True, return only categories with published content
+
+    Returns:
+        Tuple of (JSON body, ETag)
+    """
+    # Children nest to any depth in the response: one IN query per level
+    query = (
+        db.query(Category)
+        .filter(Category.parent_id.is_(None))
+        .options(selectinload(Category.children, recursion_depth=-1), raiseload("*"))
     )
 
-    if not content:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
+    if has_content:
+        # Semi-join: stops at the first published item instead of joining and
+        # de-duplicating every one
+        query = query.filter(
+            Category.content_items.any(Content.status == ContentStatus.PUBLISHED)
         )
 
-    # Increment view count
-    content.view_count += 1
-    db.commit()
+    categories = query.order_by(Category.order, Category.name).all()
 
-    # Add computed fields
-    content_dict = ContentResponse.model_validate(content).model_dump()
-    content_dict["likes_count"] = len(content.likes)
-    content_dict["comments_count"] = len(
-        [c for c in content.comments if not c.is_deleted]
-    )
+    body = CategoryList.model_validate(
+        {"items": categories, "total": len(categories)}, from_attributes=True
+    ).model_dump_json().encode()
+
+    return body, f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag.
+
+    Uses weak comparison (a ``W/`` prefix is ignored) over the
+    comma-separated list, as RFC 9110 requires for If-None-Match.
+
+    Args:
+        if_none_match: Raw header value
+        etag: Current ETag
 
-    return ContentResponse(**content_dict)
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
 
 
 @router.get("/categories", response_model=CategoryList)
 def get_categories(
     db: Annotated[Session, Depends(get_db)],
     has_content: bool = Query(False),
-) -> dict:
+    if_none_match: str | None = Header(None),
+) -> Response:
     """Get all categories.
 
     Args:
         db: Database session
         has_content: If True, return only categories with published content
+        if_none_match: ETag of the client's cached copy
 
     Returns:
-        List of categories
+        List of categories, or 304 if the client's copy is current
     """
-    query = db.query(Category).filter(Category.parent_id.is_(None))
-
-    if has_content:
-        query = (
-            query.join(Category.content_items)
-            .filter(Content.status == ContentStatus.PUBLISHED)
-            .distinct()
+    with _categories_cache_lock:
+        cached = _categories_cache.get(has_content)
+
+    if cached is None:
+        cached = _load_categories(db, has_content)
+        with _categories_cache_lock:
+            _categories_cache[has_content] = cached
+
+    body, etag = cached
+    if _etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
         )
 
-    categories = query.order_by(Category.order, Category.name).all()
-
-    return {"items": categories, "total": len(categories)}
+    return Response(body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/categories/{slug}/content", response_model=ContentList)
@@ -240,15 +331,17 @@ def get_content_by_category(
     slug: str,
     db: Annotated[Session, Depends(get_db)],
     skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     limit: int = Query(20, ge=1, le=100),
     search: str | None = Query(None),
-) -> dict:
+) -> Response:
     """Get published content by category slug.
 
     Args:
         slug: Category slug
         db: Database session
-        skip: Number of items to skip
+        skip: Number of items to skip (deprecated, use cursor)
+        cursor: Cursor from the previous page's next_cursor
         limit: Maximum number of items to return
         search: Optional search term
 
@@ -258,39 +351,38 @@ def get_content_by_category(
     Raises:
         HTTPException: If category not found
     """
-    category = db.query(Category).filter(Category.slug == slug).first()
-    if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Category not found"
-        )
+    category_id = get_or_404(
+        db, select(Category.id).where(Category.slug == slug), "Category not found"
+    )
 
     query = (
         db.query(Content)
         .filter(
-            Content.category_id == category.id,
+            Content.category_id == category_id,
             Content.status == ContentStatus.PUBLISHED,
         )
-        .options(joinedload(Content.author))
-        .order_by(Content.published_at.desc())
+        .options(list_item_columns, joinedload(Content.author), raiseload("*"))
     )
 
     if search:
-        search_filter = f"%{search}%"
-        query = query.filter(
-            (Content.title.ilike(search_filter))
-            | (Content.excerpt.ilike(search_filter))
-        )
-
-    items, total = paginate_query(query, skip, limit)
+        query = query.filter(search_filter(search))
+
+    items, total, next_cursor = paginate_page(
+        query,
+        (Content.published_at, Content.id),
+        skip,
+        cursor,
+        limit,
+        descending=True,
+    )
 
-    # Add computed fields
-    items_with_counts = []
-    for item in items:
-        item_dict = ContentListItem.model_validate(item).model_dump()
-        item_dict["likes_count"] = len(item.likes)
-        item_dict["comments_count"] = len(
-            [c for c in item.comments if not c.is_deleted]
-        )
-        items_with_counts.append(ContentListItem(**item_dict))
+    page = ContentList(
+        items=to_list_items(items),
+        total=total,
+        skip=skip,
+        limit=limit,
+        next_cursor=next_cursor,
+    )
 
-    return {"items": items_with_counts, "total": total, "skip": skip, "limit": limit}
+    # Serialize once in pydantic-core; a Response bypasses re-validation
+    return Response(page.model_dump_json(), media_type="application/json")
@@ -1,6 +1,8 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import delete, exists, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_active_user
@@ -10,10 +12,43 @@ from app.models.content import Content, ContentStatus
 from app.models.like import Like
 from app.models.subscription import Subscription
 from app.models.user import User
+from app.utils.content import content_exists
 
 router = APIRouter(prefix="/public", tags=["Public Social"])
 
 
+def _add_to_published(
+    db: Session, model: type[Like] | type[Bookmark], user_id: int, content_id: int
+) -> int | None:
+    """Insert a like or bookmark on published content in one statement.
+    
+    The row is inserted from a SELECT of the published content, and the
+    unique constraint on (user_id, content_id) settles duplicates.
+    
+    Args:
+        db: Database session
+        model: ``Like`` or ``Bookmark``
+        user_id: User ID
+        content_id: Content ID
+        
+    Returns:
+        ID of the new row, or None if the content is not published or the
+        row already exists
+    """
+    return db.execute(
+        pg_insert(model)
+        .from_select(
+            ["user_id", "content_id"],
+            select(literal(user_id), Content.id).where(
+                Content.id == content_id,
+                Content.status == ContentStatus.PUBLISHED
+            )
+        )
+        .on_conflict_do_nothing(index_elements=[model.user_id, model.content_id])
+        .returning(model.id)
+    ).scalar_one_or_none()
+
+
 # Likes
 @router.get("/content/{content_id}/like/status")
 def get_like_status(
@@ -22,12 +57,16 @@ def get_like_status(
     current_user: Annotated[User, Depends(get_current_active_user)]
 ) -> dict:
     """Check if current user liked the content."""
-    existing_like = db.query(Like).filter(
-        Like.user_id == current_user.id,
-        Like.content_id == content_id
-    ).first()
+    liked = db.scalar(
+        select(
+            exists().where(
+                Like.user_id == current_user.id,
+                Like.content_id == content_id
+            )
+        )
+    )
     
-    return {"liked": existing_like is not None}
+    return {"liked": liked}
 
 
 @router.post("/content/{content_id}/like", status_code=status.HTTP_201_CREATED)
@@ -49,33 +88,22 @@ def like_content(
     Raises:
         HTTPException: If content not found, not published, or already liked
     """
-    # Verify content exists and is published
-    content = db.query(Content).filter(
-        Content.id == content_id,
-        Content.status == ContentStatus.PUBLISHED
-    ).first()
-    
-    if not content:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Content not found"
-        )
-    
-    # Check if already liked
-    existing_like = db.query(Like).filter(
-        Like.user_id == current_user.id,
-        Like.content_id == content_id
-    ).first()
+    like_id = _add_to_published(db, Like, current_user.id, content_id)
     
-    if existing_like:
+    if like_id is None:
+        # Nothing was inserted; tell unpublished content from a duplicate
+        if not content_exists(
+            db, content_id, Content.status == ContentStatus.PUBLISHED
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Content not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Content already liked"
         )
     
-    # Create like
-    like = Like(user_id=current_user.id, content_id=content_id)
-    db.add(like)
     db.commit()
     
     return {"message": "Content liked successfully"}
@@ -100,18 +128,21 @@ def unlike_content(
     Raises:
         HTTPException: If like not found
     """
-    like = db.query(Like).filter(
-        Like.user_id == current_user.id,
-        Like.content_id == content_id
-    ).first()
+    deleted_id = db.execute(
+        delete(Like)
+        .where(
+            Like.user_id == current_user.id,
+            Like.content_id == content_id
+        )
+        .returning(Like.id)
+    ).scalar_one_or_none()
     
-    if not like:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Like not found"
         )
     
-    db.delete(like)
     db.commit()
     
     return {"message": "Content unliked successfully"}
@@ -137,33 +168,22 @@ def bookmark_content(
     Raises:
         HTTPException: If content not found, not published, or already bookmarked
     """
-    # Verify content exists and is published
-    content = db.query(Content).filter(
-        Content.id == content_id,
-        Content.status == ContentStatus.PUBLISHED
-    ).first()
-    
-    if not content:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Content not found"
-        )
-    
-    # Check if already bookmarked
-    existing_bookmark = db.query(Bookmark).filter(
-        Bookmark.user_id == current_user.id,
-        Bookmark.content_id == content_id
-    ).first()
+    bookmark_id = _add_to_published(db, Bookmark, current_user.id, content_id)
     
-    if existing_bookmark:
+    if bookmark_id is None:
+        # Nothing was inserted; tell unpublished content from a duplicate
+        if not content_exists(
+            db, content_id, Content.status == ContentStatus.PUBLISHED
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Content not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Content already bookmarked"
         )
     
-    # Create bookmark
-    bookmark = Bookmark(user_id=current_user.id, content_id=content_id)
-    db.add(bookmark)
     db.commit()
     
     return {"message": "Content bookmarked successfully"}
@@ -188,18 +208,21 @@ def remove_bookmark(
     Raises:
         HTTPException: If bookmark not found
     """
-    bookmark = db.query(Bookmark).filter(
-        Bookmark.user_id == current_user.id,
-        Bookmark.content_id == content_id
-    ).first()
+    deleted_id = db.execute(
+        delete(Bookmark)
+        .where(
+            Bookmark.user_id == current_user.id,
+            Bookmark.content_id == content_id
+        )
+        .returning(Bookmark.id)
+    ).scalar_one_or_none()
     
-    if not bookmark:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Bookmark not found"
         )
     
-    db.delete(bookmark)
     db.commit()
     
     return {"message": "Bookmark removed successfully"}
@@ -232,29 +255,36 @@ def subscribe_to_author(
             detail="Cannot subscribe to yourself"
         )
     
-    # Verify author exists
-    author = db.query(User).filter(User.id == user_id, User.is_active == True).first()
-    if not author:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
+    # Subscribe only to an active author, skipping existing subscriptions
+    subscription_id = db.execute(
+        pg_insert(Subscription)
+        .from_select(
+            ["subscriber_id", "author_id"],
+            select(literal(current_user.id), User.id).where(
+                User.id == user_id,
+                User.is_active == True
+            )
         )
+        .on_conflict_do_nothing(
+            index_elements=[Subscription.subscriber_id, Subscription.author_id]
+        )
+        .returning(Subscription.id)
+    ).scalar_one_or_none()
     
-    # Check if already subscribed
-    existing_subscription = db.query(Subscription).filter(
-        Subscription.subscriber_id == current_user.id,
-        Subscription.author_id == user_id
-    ).first()
-    
-    if existing_subscription:
+    if subscription_id is None:
+        author_exists = db.scalar(
+            select(exists().where(User.id == user_id, User.is_active == True))
+        )
+        if not author_exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Already subscribed to this author"
         )
     
-    # Create subscription
-    subscription = Subscription(subscriber_id=current_user.id, author_id=user_id)
-    db.add(subscription)
     db.commit()
     
     return {"message": "Subscribed successfully"}
@@ -279,18 +309,21 @@ def unsubscribe_from_author(
     Raises:
         HTTPException: If subscription not found
     """
-    subscription = db.query(Subscription).filter(
-        Subscription.subscriber_id == current_user.id,
-        Subscription.author_id == user_id
-    ).first()
+    deleted_id = db.execute(
+        delete(Subscription)
+        .where(
+            Subscription.subscriber_id == current_user.id,
+            Subscription.author_id == user_id
+        )
+        .returning(Subscription.id)
+    ).scalar_one_or_none()
     
-    if not subscription:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Subscription not found"
         )
     
-    db.delete(subscription)
     db.commit()
     
     return {"message": "Unsubscribed successfully"}
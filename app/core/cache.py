@@ -0,0 +1,138 @@
+import threading
+from typing import Any
+
+import orjson
+from cachetools import TLRUCache
+
+from app.core.config import settings
+
+
+class CacheService:
+    """Service for short-lived response caching (in-process or Redis)."""
+
+    def __init__(self):
+        self.cache_type = settings.CACHE_TYPE
+        self._redis = None
+
+        # Entries are (value, ttl) pairs so each key can carry its own TTL
+        self._local: TLRUCache = TLRUCache(
+            maxsize=settings.CACHE_LOCAL_SIZE,
+            ttu=lambda key, entry, now: now + entry[1],
+        )
+        self._local_lock = threading.Lock()
+
+    @property
+    def redis(self):
+        """Redis client, created on first use.
+
+        Returns:
+            Redis client bound to ``REDIS_URL``
+        """
+        if self._redis is None:
+            import redis
+
+            self._redis = redis.Redis.from_url(settings.REDIS_URL)
+        return self._redis
+
+    def get(self, key: str) -> bytes | None:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached bytes, or None on a miss or cache failure
+        """
+        if self.cache_type == "redis":
+            try:
+                return self.redis.get(key)
+            except Exception as e:
+                print(f"Cache get failed: {e}")
+                return None
+
+        with self._local_lock:
+            entry = self._local.get(key)
+        return entry[0] if entry is not None else None
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Cache a value for ``ttl`` seconds.
+
+        Args:
+            key: Cache key
+            value: Bytes to cache
+            ttl: Time to live in seconds
+        """
+        if self.cache_type == "redis":
+            try:
+                self.redis.set(key, value, ex=ttl)
+            except Exception as e:
+                print(f"Cache set failed: {e}")
+            return
+
+        with self._local_lock:
+            self._local[key] = (value, ttl)
+
+    def delete(self, *keys: str) -> None:
+        """Remove cached values.
+
+        Args:
+            *keys: Cache keys to remove
+        """
+        if not keys:
+            return
+
+        if self.cache_type == "redis":
+            try:
+                self.redis.delete(*keys)
+            except Exception as e:
+                print(f"Cache delete failed: {e}")
+            return
+
+        with self._local_lock:
+            for key in keys:
+                self._local.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Remove every cached value whose key starts with ``prefix``.
+
+        Args:
+            prefix: Key prefix
+        """
+        if self.cache_type == "redis":
+            try:
+                keys = list(self.redis.scan_iter(match=f"{prefix}*", count=500))
+                if keys:
+                    self.redis.delete(*keys)
+            except Exception as e:
+                print(f"Cache delete failed: {e}")
+            return
+
+        with self._local_lock:
+            for key in [k for k in self._local.keys() if k.startswith(prefix)]:
+                self._local.pop(key, None)
+
+    def get_json(self, key: str) -> Any | None:
+        """Get a cached JSON value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Decoded value, or None on a miss
+        """
+        raw = self.get(key)
+        return orjson.loads(raw) if raw is not None else None
+
+    def set_json(self, key: str, value: Any, ttl: int) -> None:
+        """Cache a JSON-serializable value for ``ttl`` seconds.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds
+        """
+        self.set(key, orjson.dumps(value), ttl)
+
+
+# Global cache service instance
+cache_service = CacheService()
@@ -1,6 +1,6 @@
 import json
 from typing import Annotated
-from pydantic import AnyHttpUrl, PostgresDsn, field_validator
+from pydantic import AnyHttpUrl, PostgresDsn, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -18,6 +18,29 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: PostgresDsn
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+
+    # Worker threads for sync routes and dependencies (anyio default is 40).
+    # Each can hold a pooled connection, so it defaults to, and may not
+    # exceed, DB_POOL_SIZE + DB_MAX_OVERFLOW; extra threads would only queue
+    # for a connection and fail with pool timeouts under load.
+    THREADPOOL_SIZE: int | None = None
+
+    @model_validator(mode="after")
+    def size_threadpool_to_db_pool(self) -> "Settings":
+        """Default the thread count to the connection pool limit and cap it."""
+        pool_limit = self.DB_POOL_SIZE + self.DB_MAX_OVERFLOW
+        if self.THREADPOOL_SIZE is None:
+            self.THREADPOOL_SIZE = pool_limit
+        elif self.THREADPOOL_SIZE > pool_limit:
+            raise ValueError(
+                f"THREADPOOL_SIZE ({self.THREADPOOL_SIZE}) exceeds the database "
+                f"connection limit DB_POOL_SIZE + DB_MAX_OVERFLOW ({pool_limit})"
+            )
+        return self
 
     # JWT Settings
     SECRET_KEY: str
@@ -25,6 +48,45 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # bcrypt work factor for new hashes; weaker hashes are upgraded on login
+    BCRYPT_ROUNDS: int = 12
+    # Threads for login password checks, kept apart from the shared worker
+    # threads so a burst of logins cannot starve other sync routes
+    PASSWORD_HASH_THREADS: int = 8
+
+    # Decoded token cache (seconds / entries)
+    TOKEN_CACHE_TTL: int = 5
+    TOKEN_CACHE_SIZE: int = 10000
+
+    # Authenticated user cache (seconds), kept in the response cache backend
+    # below. With Redis, role and status changes apply to every worker at
+    # once; the local backend only clears the worker that made the change, so
+    # it uses the short local TTL, which bounds how long a blocked or demoted
+    # user keeps their old access on other workers.
+    USER_CACHE_TTL: int = 30
+    USER_CACHE_LOCAL_TTL: int = 5
+
+    # Response cache: "local" (per worker) or "redis" (shared). With the local
+    # backend, invalidation only reaches the worker that made the change.
+    CACHE_TYPE: str = "local"
+    REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_LOCAL_SIZE: int = 10000
+    DASHBOARD_CACHE_TTL: int = 30  # seconds
+    # CMS category pages, cleared on category changes. The local backend only
+    # clears the worker that made the change, so it uses the short TTL, which
+    # bounds how long other workers serve the old list.
+    CATEGORY_CACHE_TTL: int = 3600  # seconds, with Redis
+    CATEGORY_CACHE_LOCAL_TTL: int = 30  # seconds, with the local backend
+    # Public category list, kept per worker; category changes clear the local
+    # worker immediately, other workers (and has_content) within the TTL
+    PUBLIC_CATEGORIES_CACHE_TTL: int = 300  # seconds
+    # Public content detail; cleared on edits and publish changes, while like,
+    # comment and view counts may lag by up to the TTL
+    CONTENT_CACHE_TTL: int = 300  # seconds
+
+    # How often buffered content view counts are written to the database
+    VIEW_COUNT_FLUSH_INTERVAL: int = 30  # seconds
+
     # Cookie Settings
     COOKIE_DOMAIN: str | None = None
     COOKIE_SECURE: bool = False
@@ -49,11 +111,21 @@ class Settings(BaseSettings):
     # Upload Settings
     UPLOAD_DIR: str = "uploads"
     MAX_UPLOAD_SIZE: int = 10485760  # 10MB
-    ALLOWED_IMAGE_EXTENSIONS: set[str] = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
+    ALLOWED_IMAGE_EXTENSIONS: frozenset[str] = frozenset(
+        {".jpg", ".jpeg", ".png", ".webp", ".gif"}
+    )
 
     # Image Optimization
     MAX_IMAGE_WIDTH: int = 1920
     IMAGE_QUALITY: int = 85
+    # How close to the target size images are pre-shrunk (JPEG DCT scaling,
+    # then whole-factor reduce) before the LANCZOS pass; higher is slower and
+    # closer to a full-size resample
+    IMAGE_REDUCING_GAP: float = 1.0
+    # JPEG/PNG/WebP uploads up to this size that need no resize and carry no
+    # metadata (EXIF, XMP, comments, PNG text chunks) are stored as uploaded;
+    # everything else is re-encoded, which strips the metadata
+    IMAGE_PASSTHROUGH_MAX_SIZE: int = 512 * 1024  # bytes
 
     # Storage Settings (for future S3 integration)
     STORAGE_TYPE: str = "local"  # "local" or "s3"
@@ -61,6 +133,11 @@ class Settings(BaseSettings):
     AWS_SECRET_ACCESS_KEY: str = ""
     AWS_REGION: str = ""
     S3_BUCKET_NAME: str = ""
+    # Keep-alive connections shared by concurrent uploads and deletes
+    S3_MAX_POOL_CONNECTIONS: int = 50
+    # Parts of one multipart upload sent in parallel; memory per upload is
+    # bounded by this times the 8MB part size
+    S3_UPLOAD_CONCURRENCY: int = 10
 
     @property
     def is_s3_configured(self) -> bool:
@@ -1,13 +1,37 @@
+import hashlib
+import threading
+import time
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, TypeVar
 
-from jose import jwt
+import anyio
+import anyio.to_thread
+from cachetools import TTLCache
+from jose import ExpiredSignatureError, JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+)
+
+# Recently verified token payloads, keyed by SHA-256 of the raw token
+_token_cache: TTLCache = TTLCache(
+    maxsize=settings.TOKEN_CACHE_SIZE, ttl=settings.TOKEN_CACHE_TTL
+)
+_token_cache_lock = threading.Lock()
+_INVALID_TOKEN = object()
+
+T = TypeVar("T")
+
+# Limiter for bcrypt work, created on first use inside the event loop
+_password_hash_limiter: anyio.CapacityLimiter | None = None
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -23,6 +47,47 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verify a password and rehash it if it uses an outdated work factor.
+    
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password from database
+        
+    Returns:
+        Tuple of (matches, new_hash); new_hash is None unless the stored hash
+        should be replaced
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def dummy_verify_password() -> None:
+    """Spend the time of a password check without a real hash.
+    
+    Used when no user matches, so response timing does not reveal which
+    emails are registered.
+    """
+    pwd_context.dummy_verify()
+
+
+async def run_password_hashing(func: Callable[..., T], *args: Any) -> T:
+    """Run a bcrypt call on the dedicated password hashing threads.
+    
+    Args:
+        func: Blocking password function (e.g. ``verify_and_update_password``)
+        *args: Arguments for ``func``
+        
+    Returns:
+        Result of ``func``
+    """
+    global _password_hash_limiter
+    if _password_hash_limiter is None:
+        _password_hash_limiter = anyio.CapacityLimiter(settings.PASSWORD_HASH_THREADS)
+    return await anyio.to_thread.run_sync(func, *args, limiter=_password_hash_limiter)
+
+
 def get_password_hash(password: str) -> str:
     """Hash a password.
     
@@ -89,3 +154,46 @@ def decode_token(token: str) -> dict[str, Any]:
         JWTError: If token is invalid or expired
     """
     return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+
+def decode_token_cached(token: str) -> dict[str, Any]:
+    """Decode a JWT token, reusing recently verified payloads.
+
+    Payloads are cached for ``TOKEN_CACHE_TTL`` seconds, which is kept well
+    below the access token lifetime. Invalid tokens are remembered as well so
+    a repeated bad token does not trigger a signature check on every request.
+    Only verified payloads are cached; a hit skips the signature check but
+    still enforces ``exp``, so a token cannot outlive its expiry by the TTL.
+
+    Args:
+        token: JWT token to decode
+
+    Returns:
+        Decoded token payload
+
+    Raises:
+        JWTError: If token is invalid or expired
+    """
+    key = hashlib.sha256(token.encode()).digest()
+
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+
+    if payload is _INVALID_TOKEN:
+        raise JWTError("Invalid token")
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is not None and exp <= time.time():
+            raise ExpiredSignatureError("Signature has expired.")
+        return payload
+
+    try:
+        payload = decode_token(token)
+    except JWTError:
+        with _token_cache_lock:
+            _token_cache[key] = _INVALID_TOKEN
+        raise
+
+    with _token_cache_lock:
+        _token_cache[key] = payload
+    return payload
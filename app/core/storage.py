@@ -1,25 +1,116 @@
+import functools
 import os
+import shutil
+import threading
 import uuid
 from io import BytesIO
 from pathlib import Path
 from typing import BinaryIO, Tuple
 
+import anyio.to_thread
 from fastapi import HTTPException, UploadFile, status
 from PIL import Image
 
 from app.core.config import settings
 
+# Uploads to S3 switch to multipart above, and are sent in parts of, this size
+S3_PART_SIZE = 8 * 1024 * 1024
+
+# Buffer used when copying uploads to local disk
+LOCAL_COPY_CHUNK_SIZE = 64 * 1024
+
+# Pillow formats matching the allowed extensions; only these decoders are
+# tried when sniffing an upload
+_ALLOWED_IMAGE_FORMATS = tuple(
+    sorted(
+        {
+            Image.registered_extensions()[ext]
+            for ext in settings.ALLOWED_IMAGE_EXTENSIONS
+        }
+    )
+)
+
+# Header fields that describe the encoding rather than the photo or its
+# author; anything else (EXIF, XMP, comments, PNG text chunks) is metadata
+# that must not be published as uploaded
+_STRUCTURAL_IMAGE_INFO = frozenset(
+    {
+        "adobe",
+        "adobe_transform",
+        "aspect",
+        "background",
+        "dpi",
+        "gamma",
+        "interlace",
+        "jfif",
+        "jfif_density",
+        "jfif_unit",
+        "jfif_version",
+        "progression",
+        "progressive",
+        "srgb",
+        "transparency",
+    }
+)
+
+_INVALID_TYPE_DETAIL = (
+    f"Invalid file type. Allowed: {', '.join(sorted(settings.ALLOWED_IMAGE_EXTENSIONS))}"
+)
+
 
 class StorageService:
     """Service for handling file storage (local or S3)."""
 
     def __init__(self):
         self.storage_type = settings.STORAGE_TYPE
+        self._s3_client = None
+        self._s3_client_lock = threading.Lock()
 
         # Ensure upload directory exists for local storage
         if self.storage_type == "local":
             Path(settings.UPLOAD_DIR).mkdir(parents=True, exist_ok=True)
 
+    @property
+    def s3_client(self):
+        """S3 client, created on first use and shared by all requests.
+
+        Returns:
+            boto3 S3 client for the configured credentials and region
+        """
+        if self._s3_client is None:
+            with self._s3_client_lock:
+                if self._s3_client is None:
+                    import boto3
+                    from botocore.config import Config
+
+                    self._s3_client = boto3.client(
+                        "s3",
+                        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                        region_name=settings.AWS_REGION,
+                        config=Config(
+                            max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                            retries={"max_attempts": 3, "mode": "adaptive"},
+                        ),
+                    )
+        return self._s3_client
+
+    @functools.cached_property
+    def s3_transfer_config(self):
+        """Multipart settings shared by all S3 uploads.
+
+        Returns:
+            boto3 TransferConfig with the part size and upload concurrency
+        """
+        from boto3.s3.transfer import TransferConfig
+
+        return TransferConfig(
+            multipart_threshold=S3_PART_SIZE,
+            multipart_chunksize=S3_PART_SIZE,
+            max_concurrency=settings.S3_UPLOAD_CONCURRENCY,
+            use_threads=True,
+        )
+
     def generate_unique_filename(self, original_filename: str) -> str:
         """Generate a unique filename while preserving extension.
 
@@ -47,13 +138,15 @@ class StorageService:
         if ext not in settings.ALLOWED_IMAGE_EXTENSIONS:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid file type. Allowed: {', '.join(settings.ALLOWED_IMAGE_EXTENSIONS)}",
+                detail=_INVALID_TYPE_DETAIL,
             )
 
-        # Check file size
-        file.file.seek(0, 2)  # Seek to end
-        file_size = file.file.tell()
-        file.file.seek(0)  # Reset to beginning
+        # Check file size (counted by Starlette while spooling the upload)
+        file_size = file.size
+        if file_size is None:
+            file.file.seek(0, 2)  # Seek to end
+            file_size = file.file.tell()
+            file.file.seek(0)  # Reset to beginning
 
         if file_size > settings.MAX_UPLOAD_SIZE:
             raise HTTPException(
@@ -61,24 +154,26 @@ class StorageService:
                 detail=f"File too large. Maximum size: {settings.MAX_UPLOAD_SIZE / 1024 / 1024}MB",
             )
 
-        # Validate it's actually an image
+        # Validate it's actually an image: Image.open only reads the header
+        # (magic bytes, format and size), unlike verify() which walks the
+        # whole file; pixel data is decoded later only if a resize is needed
         try:
-            image = Image.open(file.file)
-            image.verify()
-            file.file.seek(0)  # Reset after verification
+            Image.open(file.file, formats=_ALLOWED_IMAGE_FORMATS)
+            file.file.seek(0)  # Reset after sniffing
         except Exception:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid image file"
             )
 
-    def process_image(self, file: UploadFile) -> Tuple[bytes, str]:
+    def process_image(self, file: UploadFile) -> Tuple[BinaryIO, str]:
         """Process image: resize and optimize.
 
         Args:
             file: UploadFile object
 
         Returns:
-            Tuple of (processed_bytes, content_type)
+            Tuple of (processed file object positioned at the start,
+            content_type)
         """
         try:
             image = Image.open(file.file)
@@ -93,12 +188,40 @@ class StorageService:
             orig_format = image.format
             content_type = file.content_type
 
-            # Resize if too large
+            # Image.open only parsed the header; skip the encode round trip
+            # for small images that are already within bounds and carry no
+            # metadata (re-encoding is what strips EXIF such as GPS position).
+            # They are still decoded once so truncated or corrupt files are
+            # rejected rather than stored as uploaded
+            try:
+                passthrough = (
+                    orig_format in ("JPEG", "PNG", "WEBP")
+                    and image.width <= settings.MAX_IMAGE_WIDTH
+                    and file.size is not None
+                    and file.size <= settings.IMAGE_PASSTHROUGH_MAX_SIZE
+                    and image.info.keys() <= _STRUCTURAL_IMAGE_INFO
+                    and not image.getexif()
+                )
+                if passthrough:
+                    image.load()
+            except (OSError, SyntaxError):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid image file",
+                )
+
+            if passthrough:
+                file.file.seek(0)
+                return file.file, Image.MIME[orig_format]
+
+            # Resize if too large. thumbnail() lets libjpeg decode JPEGs at a
+            # reduced scale and shrinks by whole factors before the final
+            # LANCZOS pass, instead of filtering the full-size image
             if image.width > settings.MAX_IMAGE_WIDTH:
-                ratio = settings.MAX_IMAGE_WIDTH / image.width
-                new_height = int(image.height * ratio)
-                image = image.resize(
-                    (settings.MAX_IMAGE_WIDTH, new_height), Image.Resampling.LANCZOS
+                image.thumbnail(
+                    (settings.MAX_IMAGE_WIDTH, image.height),
+                    Image.Resampling.LANCZOS,
+                    reducing_gap=settings.IMAGE_REDUCING_GAP,
                 )
 
             output = BytesIO()
@@ -121,19 +244,22 @@ class StorageService:
                 # Fallback for others (GIF, etc) - just save as is or converted
                 image.save(output, format=orig_format)
 
-            return output.getvalue(), content_type
+            output.seek(0)
+            return output, content_type
 
+        except HTTPException:
+            raise
         except Exception as e:
-            # Fallback: return original content if processing fails
+            # Fallback: store the original upload if processing fails
             print(f"Image processing failed: {e}")
             file.file.seek(0)
-            return file.file.read(), file.content_type
+            return file.file, file.content_type
 
-    async def save_file_local(self, content: bytes, filename: str) -> str:
-        """Save file to local storage.
+    async def save_file_local(self, content: BinaryIO, filename: str) -> str:
+        """Save file to local storage, copying it in chunks.
 
         Args:
-            content: File content bytes
+            content: File object positioned at the start of the content
             filename: Filename to use
 
         Returns:
@@ -141,18 +267,23 @@ class StorageService:
         """
         file_path = Path(settings.UPLOAD_DIR) / filename
 
-        with open(file_path, "wb") as buffer:
-            buffer.write(content)
+        def copy_to_disk() -> None:
+            with open(file_path, "wb") as buffer:
+                shutil.copyfileobj(content, buffer, LOCAL_COPY_CHUNK_SIZE)
+
+        # Disk writes block; run the copy on the threadpool so other requests
+        # on this worker keep being served meanwhile
+        await anyio.to_thread.run_sync(copy_to_disk)
 
         return str(file_path)
 
     async def save_file_s3(
-        self, content: bytes, filename: str, content_type: str
+        self, content: BinaryIO, filename: str, content_type: str
     ) -> str:
-        """Save file to S3 storage.
+        """Save file to S3 storage, as a multipart upload when it is large.
 
         Args:
-            content: File content bytes
+            content: File object positioned at the start of the content
             filename: Filename to use
             content_type: MIME type
 
@@ -163,23 +294,20 @@ class StorageService:
             HTTPException: If S3 upload fails
         """
         try:
-            import boto3
             from botocore.exceptions import ClientError
 
-            # Create S3 client
-            s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=settings.AWS_REGION,
-            )
-
-            # Upload to S3
-            s3_client.put_object(
-                Bucket=settings.S3_BUCKET_NAME,
-                Key=filename,
-                Body=content,
-                ContentType=content_type,
+            # Upload to S3, streaming parts (concurrently above the threshold)
+            # instead of sending one buffered body; boto3 blocks, so the
+            # transfer runs on the threadpool
+            await anyio.to_thread.run_sync(
+                functools.partial(
+                    self.s3_client.upload_fileobj,
+                    content,
+                    settings.S3_BUCKET_NAME,
+                    filename,
+                    ExtraArgs={"ContentType": content_type},
+                    Config=self.s3_transfer_config,
+                )
             )
 
             # Generate public URL
@@ -206,12 +334,17 @@ class StorageService:
         Returns:
             Tuple of (filename, file_path/url, file_size)
         """
-        # Validate image
-        self.validate_image(file)
+        # Decoding and re-encoding are CPU-bound; run them on the threadpool
+        # (Pillow releases the GIL) instead of blocking the event loop
+        await anyio.to_thread.run_sync(self.validate_image, file)
 
         # Process image (resize/optimize)
-        content, content_type = self.process_image(file)
-        file_size = len(content)
+        content, content_type = await anyio.to_thread.run_sync(
+            self.process_image, file
+        )
+        content.seek(0, 2)
+        file_size = content.tell()
+        content.seek(0)
 
         # Generate unique filename
         filename = self.generate_unique_filename(file.filename or "upload")
@@ -257,19 +390,8 @@ class StorageService:
             filename: Filename to delete
         """
         try:
-            import boto3
-            from botocore.exceptions import ClientError
-
-            # Create S3 client
-            s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=settings.AWS_REGION,
-            )
-
             # Delete from S3
-            s3_client.delete_object(Bucket=settings.S3_BUCKET_NAME, Key=filename)
+            self.s3_client.delete_object(Bucket=settings.S3_BUCKET_NAME, Key=filename)
         except Exception:
             # Silently fail - file might not exist
             pass
@@ -7,11 +7,24 @@ from app.core.config import settings
 engine = create_engine(
     str(settings.DATABASE_URL),
     pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    # Reuse the most recent connection so idle extras can age out
+    pool_use_lifo=True,
     echo=settings.DEBUG
 )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create session factory. Instances are not expired on commit: Python-side
+# defaults and onupdate values (e.g. updated_at) are set on the instance at
+# flush, so they stay valid. Values the database maintains are not: the
+# trigger-kept Content.likes_count/comments_count and anything changed by a
+# Core UPDATE. Routes that return such values after a write must
+# db.refresh() the instance first.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 class Base(DeclarativeBase):
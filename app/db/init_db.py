@@ -1,3 +1,4 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.security import get_password_hash
@@ -37,11 +38,11 @@ def init_db(db: Session) -> None:
         {"name": "Технологии", "slug": "technology", "order": 6},
     ]
     
+    # One lookup for the slugs already present, then a batched insert
+    existing = set(db.scalars(select(Category.slug)))
     for cat_data in default_categories:
-        category = db.query(Category).filter(Category.slug == cat_data["slug"]).first()
-        if not category:
-            category = Category(**cat_data)
-            db.add(category)
+        if cat_data["slug"] not in existing:
+            db.add(Category(**cat_data))
             print(f"✓ Created category: {cat_data['name']}")
     
     db.commit()
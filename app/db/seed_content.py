@@ -1,6 +1,7 @@
 """Seed database with sample content."""
 from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.security import get_password_hash
@@ -164,12 +165,20 @@ def create_sample_news(db: Session, users: dict[str, User], categories: dict[str
         }
     ]
     
+    # One lookup for the titles already seeded, then a batched insert
+    existing = set(
+        db.scalars(
+            select(Content.title).where(
+                Content.title.in_([item["title"] for item in news_data])
+            )
+        )
+    )
+    
     for i, news in enumerate(news_data):
         category = categories.get(news["category"])
         author = users.get(news["author"])
         
-        existing = db.query(Content).filter(Content.title == news["title"]).first()
-        if not existing:
+        if news["title"] not in existing:
             content = Content(
                 title=news["title"],
                 slug=f"news-{i+1}",
@@ -310,12 +319,20 @@ IT-мамандарды даярлау бағдарламалары кеңейт
         }
     ]
     
+    # One lookup for the titles already seeded, then a batched insert
+    existing = set(
+        db.scalars(
+            select(Content.title).where(
+                Content.title.in_([item["title"] for item in articles_data])
+            )
+        )
+    )
+    
     for i, article in enumerate(articles_data):
         category = categories.get(article["category"])
         author = users.get(article["author"])
         
-        existing = db.query(Content).filter(Content.title == article["title"]).first()
-        if not existing:
+        if article["title"] not in existing:
             content = Content(
                 title=article["title"],
                 slug=f"article-{i+1}",
@@ -342,12 +359,14 @@ def seed_content():
     try:
         # Get categories
         categories = {
-            "politics": db.query(Category).filter(Category.slug == "politics").first(),
-            "economics": db.query(Category).filter(Category.slug == "economics").first(),
-            "society": db.query(Category).filter(Category.slug == "society").first(),
-            "culture": db.query(Category).filter(Category.slug == "culture").first(),
-            "sport": db.query(Category).filter(Category.slug == "sport").first(),
-            "technology": db.query(Category).filter(Category.slug == "technology").first(),
+            category.slug: category
+            for category in db.scalars(
+                select(Category).where(
+                    Category.slug.in_(
+                        ["politics", "economics", "society", "culture", "sport", "technology"]
+                    )
+                )
+            )
         }
         
         # Create sample users
@@ -1,9 +1,14 @@
 """Update slugs for existing content."""
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
 
 from app.db.base import SessionLocal
 from app.models.content import Content
-from app.utils.slug import generate_unique_slug
+from app.utils.content import invalidate_content_cache
+from app.utils.slug import generate_slug
+
+
+# Rows read, updated and committed per batch
+BATCH_SIZE = 2000
 
 
 def update_content_slugs():
@@ -12,21 +17,61 @@ def update_content_slugs():
     db = SessionLocal()
     
     try:
-        # Get all content
-        all_content = db.query(Content).all()
+        # Every current slug, so new ones never collide (slugs only)
+        taken = set(db.scalars(select(Content.slug)))
         
-        for content in all_content:
-            # Generate new slug from title
-            new_slug = generate_unique_slug(db, Content, content.title)
+        updated = 0
+        scanned = 0
+        last_id = 0
+        while True:
+            # Walk the table by id, one batch of id/title/slug at a time
+            rows = db.execute(
+                select(Content.id, Content.title, Content.slug)
+                .where(Content.id > last_id)
+                .order_by(Content.id)
+                .limit(BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            scanned += len(rows)
+            
+            # Pick every new slug in Python. A row keeps its own slug if it
+            # already matches, and never takes one still held by another row,
+            # so the unique constraint holds after each individual row update.
+            changes = []
+            for row in rows:
+                base_slug = generate_slug(row.title, 90)  # Reserve space for counter
+                new_slug = base_slug
+                counter = 1
+                while new_slug != row.slug and new_slug in taken:
+                    new_slug = f"{base_slug}-{counter}"
+                    counter += 1
+                
+                if new_slug == row.slug:
+                    continue
+                
+                taken.add(new_slug)
+                changes.append({"id": row.id, "slug": new_slug, "old_slug": row.slug})
+                
+                print(f"Updating: {row.title[:50]}...")
+                print(f"  Old slug: {row.slug}")
+                print(f"  New slug: {new_slug}")
             
-            print(f"Updating: {content.title[:50]}...")
-            print(f"  Old slug: {content.slug}")
-            print(f"  New slug: {new_slug}")
+            if not changes:
+                continue
             
-            content.slug = new_slug
+            # One executemany UPDATE keyed by primary key, committed per batch
+            # so no transaction spans the whole table
+            db.execute(
+                update(Content),
+                [{"id": change["id"], "slug": change["slug"]} for change in changes],
+            )
+            db.commit()
+            invalidate_content_cache(*(change["old_slug"] for change in changes))
+            updated += len(changes)
         
-        db.commit()
-        print(f"\n✓ Updated {len(all_content)} content items")
+        print(f"\n✓ Updated {updated} of {scanned} content items")
         
     finally:
         db.close()
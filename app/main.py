@@ -1,7 +1,10 @@
+import asyncio
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import anyio.to_thread
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.api.routes import auth, media
@@ -15,6 +18,15 @@ from app.api.routes.cms import (
     publishing_editor,
 )
 from app.core.config import settings
+from app.core.view_counter import view_counter
+from app.utils.pagination import InvalidCursorError
+
+
+async def flush_view_counts() -> None:
+    """Periodically write buffered view counts to the database."""
+    while True:
+        await asyncio.sleep(settings.VIEW_COUNT_FLUSH_INTERVAL)
+        await anyio.to_thread.run_sync(view_counter.flush)
 
 
 @asynccontextmanager
@@ -27,9 +39,16 @@ async def lifespan(app: FastAPI):
     print(f"AWS Key Present: {bool(settings.AWS_ACCESS_KEY_ID)}")
     print(f"AWS Secret Present: {bool(settings.AWS_SECRET_ACCESS_KEY)}")
     print(f"Bucket: {settings.S3_BUCKET_NAME}")
+    # Sync routes share this limiter; sized to the DB pool (see Settings)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.THREADPOOL_SIZE
+    )
+    view_count_flusher = asyncio.create_task(flush_view_counts())
     yield
     # Shutdown
     print("Shutting down...")
+    view_count_flusher.cancel()
+    await anyio.to_thread.run_sync(view_counter.flush)
 
 
 # Create FastAPI application
@@ -38,8 +57,18 @@ app = FastAPI(
     version=settings.VERSION,
     description="Backend API for Qazaq news and article publishing platform",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+    """Reject malformed pagination cursors as a client error."""
+    return ORJSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST, content={"detail": "Invalid cursor"}
+    )
+
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
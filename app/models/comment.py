@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -15,6 +15,21 @@ class Comment(Base):
     """Comment model for user comments on content."""
     
     __tablename__ = "comments"
+    __table_args__ = (
+        Index(
+            "ix_comments_created_at_id_visible",
+            "created_at",
+            "id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_comments_content_id_parent_id_is_deleted_created_at",
+            "content_id",
+            "parent_id",
+            "is_deleted",
+            "created_at",
+        ),
+    )
     
     # Primary fields
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
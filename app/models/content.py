@@ -2,7 +2,7 @@ import enum
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -37,6 +37,26 @@ class Content(Base):
     """Content model for news and articles."""
 
     __tablename__ = "content"
+    __table_args__ = (
+        Index("ix_content_created_at_id", "created_at", "id"),
+        Index("ix_content_author_id_status", "author_id", "status"),
+        Index("ix_content_author_id_created_at_id", "author_id", "created_at", "id"),
+        Index("ix_content_status_updated_at_id", "status", "updated_at", "id"),
+        Index(
+            "ix_content_status_type_published_at_id",
+            "status",
+            "type",
+            "published_at",
+            "id",
+        ),
+        Index(
+            "ix_content_category_id_status_published_at_id",
+            "category_id",
+            "status",
+            "published_at",
+            "id",
+        ),
+    )
 
     # Primary fields
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -84,6 +104,13 @@ class Content(Base):
 
     # Metrics
     view_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Maintained by database triggers on likes and comments (visible only)
+    likes_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    comments_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -2,7 +2,7 @@ import enum
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Enum, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -30,6 +30,9 @@ class User(Base):
     """User model for authentication and authorization."""
     
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
     
     # Primary fields
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -110,3 +113,8 @@ class User(Base):
     
     def __repr__(self) -> str:
         return f"<User(id={self.id}, username='{self.username}', role='{self.role}')>"
+
+
+# Case-insensitive uniqueness, also backing the lower() lookups in auth
+Index("ix_users_email_lower", func.lower(User.email), unique=True)
+Index("ix_users_username_lower", func.lower(User.username), unique=True)
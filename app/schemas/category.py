@@ -41,3 +41,4 @@ class CategoryList(BaseModel):
     """Schema for category list."""
     items: list[CategoryResponse]
     total: int
+    next_cursor: str | None = None
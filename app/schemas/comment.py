@@ -40,3 +40,4 @@ class CommentList(BaseModel):
     """Schema for paginated comment list."""
     items: list[CommentResponse]
     total: int
+    next_cursor: str | None = None
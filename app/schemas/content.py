@@ -107,6 +107,7 @@ class ContentList(BaseModel):
     total: int
     skip: int
     limit: int
+    next_cursor: str | None = None
 
 
 class RevisionResponse(BaseModel):
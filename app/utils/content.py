@@ -0,0 +1,166 @@
+from collections.abc import Sequence
+
+from pydantic import TypeAdapter
+from sqlalchemy import ColumnElement, exists, func, select, update
+from sqlalchemy.orm import Session, load_only
+
+from app.core.cache import cache_service
+from app.models.content import Content, ContentStatus
+from app.schemas.content import ContentListItem
+
+# Validates a whole page in one call into pydantic-core
+_list_items_adapter = TypeAdapter(list[ContentListItem])
+
+# Columns read by ContentListItem plus the FK and sort keys list queries use;
+# the article body is never fetched for lists
+list_item_columns = load_only(
+    Content.id,
+    Content.title,
+    Content.slug,
+    Content.excerpt,
+    Content.type,
+    Content.status,
+    Content.is_pinned,
+    Content.cover_image_url,
+    Content.author_id,
+    Content.view_count,
+    Content.likes_count,
+    Content.comments_count,
+    Content.published_at,
+    Content.created_at,
+    Content.updated_at,
+    raiseload=True,
+)
+
+
+def search_filter(term: str) -> ColumnElement[bool]:
+    """Build a case-insensitive substring match on title or excerpt.
+    
+    Emits plain ``ILIKE '%term%'`` on the bare columns so the pg_trgm GIN
+    indexes on ``title`` and ``excerpt`` can serve it (terms of three or more
+    characters). ``%``, ``_`` and ``\\`` in the term match literally.
+    
+    Args:
+        term: Search text as entered by the user
+        
+    Returns:
+        Filter condition for a ``Content`` query
+    """
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    pattern = f"%{escaped}%"
+    return Content.title.ilike(pattern, escape="\\") | Content.excerpt.ilike(
+        pattern, escape="\\"
+    )
+
+
+def to_list_items(items: Sequence[Content]) -> list[ContentListItem]:
+    """Validate a page of content into list items in one pass.
+    
+    Args:
+        items: Content instances with their authors loaded
+        
+    Returns:
+        List items
+    """
+    return _list_items_adapter.validate_python(items, from_attributes=True)
+
+
+def count_by_status(
+    db: Session, statuses: list[ContentStatus], *criteria
+) -> dict[ContentStatus, int]:
+    """Count content per status in a single grouped query.
+    
+    Args:
+        db: Database session
+        statuses: Statuses to count
+        *criteria: Extra filter conditions (e.g. author)
+        
+    Returns:
+        Count for each requested status, zero when none match
+    """
+    rows = (
+        db.query(Content.status, func.count(Content.id))
+        .filter(Content.status.in_(statuses), *criteria)
+        .group_by(Content.status)
+        .all()
+    )
+    counts = dict.fromkeys(statuses, 0)
+    counts.update(rows)
+    return counts
+
+
+def transition_status(
+    db: Session,
+    content_id: int,
+    from_statuses: list[ContentStatus],
+    to_status: ContentStatus,
+    *criteria,
+) -> int | None:
+    """Move content to a new status if it is currently in an allowed one.
+    
+    Runs as a single ``UPDATE ... RETURNING`` without loading the row.
+    
+    Args:
+        db: Database session
+        content_id: Content ID
+        from_statuses: Statuses the content may currently be in
+        to_status: New status
+        *criteria: Extra filter conditions (e.g. author)
+        
+    Returns:
+        Author ID of the updated content, or None if nothing matched
+    """
+    return db.execute(
+        update(Content)
+        .where(
+            Content.id == content_id, Content.status.in_(from_statuses), *criteria
+        )
+        .values(status=to_status)
+        .returning(Content.author_id)
+    ).scalar_one_or_none()
+
+
+def content_exists(db: Session, content_id: int, *criteria) -> bool:
+    """Check whether content exists, used to tell 404 from 400 after a miss.
+    
+    Args:
+        db: Database session
+        content_id: Content ID
+        *criteria: Extra filter conditions (e.g. author)
+        
+    Returns:
+        True if matching content exists
+    """
+    return db.scalar(select(exists().where(Content.id == content_id, *criteria)))
+
+
+def invalidate_dashboards(author_id: int) -> None:
+    """Drop cached dashboard counts affected by a change to an author's content.
+    
+    Args:
+        author_id: Author of the content that was created, changed or deleted
+    """
+    cache_service.delete(
+        "dashboard:chief", "dashboard:publishing", f"dashboard:editor:{author_id}"
+    )
+
+
+def content_cache_key(slug: str) -> str:
+    """Cache key for a published content item's public detail.
+
+    Args:
+        slug: Content slug
+
+    Returns:
+        Cache key
+    """
+    return f"content:slug:{slug}:v1"
+
+
+def invalidate_content_cache(*slugs: str) -> None:
+    """Drop cached public content details.
+    
+    Args:
+        *slugs: Slugs of the content items that changed
+    """
+    cache_service.delete(*(content_cache_key(slug) for slug in slugs))
@@ -0,0 +1,26 @@
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+
+def get_or_404(db: Session, stmt: Select, detail: str = "Not found") -> Any:
+    """Run a single-row ``select()`` and return its first column.
+
+    Args:
+        db: Database session
+        stmt: Statement matching at most one row (by primary key or a
+            unique column)
+        detail: Error detail when nothing matches
+
+    Returns:
+        The ORM instance or scalar selected by ``stmt``
+
+    Raises:
+        HTTPException: If no row matches
+    """
+    obj = db.execute(stmt).scalar_one_or_none()
+    if obj is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+    return obj
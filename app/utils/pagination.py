@@ -1,6 +1,12 @@
-from typing import TypeVar
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any, TypeVar
 
 from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Row, and_, func, inspect, or_, tuple_
 from sqlalchemy.orm import Query
 
 T = TypeVar("T")
@@ -15,17 +21,281 @@ class PaginationParams(BaseModel):
         super().__init__(skip=max(0, skip), limit=min(max(1, limit), 100))
 
 
+def _offset_page(
+    query: Query, skip: int, limit: int, with_total: bool = True
+) -> tuple[list[Any], int | None]:
+    """Fetch one OFFSET page through a deferred join.
+    
+    The OFFSET/LIMIT runs on a subquery that selects only primary keys (plus
+    ``count(*) OVER ()`` when ``with_total``), so skipped rows are never
+    materialized in full; the outer query then loads the page's rows,
+    options and extra columns by key. The primary key is appended to the
+    ordering so both levels agree on ties.
+    
+    Args:
+        query: Ordered query whose first column is an entity
+        skip: Number of items to skip
+        limit: Maximum number of items to return
+        with_total: Also read the total matching rows from the subquery
+        
+    Returns:
+        Tuple of (items, total); total is None when not requested or when the
+        page is empty. Items are entities, or tuples when the query selects
+        several columns.
+    """
+    width = len(query.column_descriptions)
+    pk = inspect(query.column_descriptions[0]["entity"]).primary_key[0]
+    query = query.order_by(pk)
+    
+    page_columns = [pk.label("page_id")]
+    if with_total:
+        page_columns.append(func.count().over().label("total"))
+    page = query.with_entities(*page_columns).offset(skip).limit(limit).subquery()
+    
+    paged = query.join(page, pk == page.c.page_id)
+    if with_total:
+        paged = paged.add_columns(page.c.total)
+    rows = paged.all()
+    
+    if not with_total:
+        return rows, None
+    
+    total = rows[0][-1] if rows else None
+    items = [row[0] if width == 1 else tuple(row[:width]) for row in rows]
+    return items, total
+
+
 def paginate_query(query: Query, skip: int = 0, limit: int = 20) -> tuple[list[T], int]:
     """Paginate a SQLAlchemy query.
     
+    Rows and total are fetched in one round-trip: the total is a
+    ``count(*) OVER ()`` column of the deferred-join key subquery (see
+    ``_offset_page``). ``query`` must not use DISTINCT.
+    
     Args:
         query: SQLAlchemy query to paginate
         skip: Number of items to skip
         limit: Maximum number of items to return
         
     Returns:
-        Tuple of (items, total_count)
+        Tuple of (items, total_count); items are entities, or tuples when
+        the query selects several columns
     """
-    total = query.count()
-    items = query.offset(skip).limit(limit).all()
+    items, total = _offset_page(query, skip, limit)
+    
+    if total is None:
+        # An OFFSET past the end returns no rows to read the total from
+        total = query.count() if skip else 0
+    
     return items, total
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode a keyset position as an opaque cursor string.
+    
+    Args:
+        *values: Sort key values of the last item on the page
+        
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        separators=(",", ":"),
+    ).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> tuple:
+    """Decode a cursor produced by ``encode_cursor``.
+    
+    Args:
+        cursor: Cursor string
+        columns: Sort columns the cursor was built from
+        
+    Returns:
+        Tuple of sort key values, converted to the columns' Python types
+        
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise InvalidCursorError("Invalid cursor")
+        
+        decoded = []
+        for index, (column, value) in enumerate(zip(columns, values)):
+            python_type = column.type.python_type
+            if value is None:
+                # Only a nullable leading column can hold NULL (see _ordering)
+                if index or not _is_nullable(column):
+                    raise InvalidCursorError("Invalid cursor")
+            elif python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif not isinstance(value, python_type):
+                raise InvalidCursorError("Invalid cursor")
+            decoded.append(value)
+        return tuple(decoded)
+    except (binascii.Error, TypeError, ValueError) as e:
+        if isinstance(e, InvalidCursorError):
+            raise
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def _is_nullable(column: Any) -> bool:
+    """Whether a sort column can hold NULL."""
+    return bool(getattr(column.expression, "nullable", False))
+
+
+def _ordering(columns: Sequence[Any], descending: bool) -> list[Any]:
+    """ORDER BY clauses for a keyset over ``columns``.
+    
+    A nullable leading column (e.g. ``published_at``) sorts its NULLs first
+    when descending and last when ascending, which is Postgres's default, so
+    indexes on the columns still serve the ordering.
+    """
+    ordering = [c.desc() if descending else c.asc() for c in columns]
+    if _is_nullable(columns[0]):
+        ordering[0] = ordering[0].nulls_first() if descending else ordering[0].nulls_last()
+    return ordering
+
+
+def _after(columns: Sequence[Any], values: tuple, descending: bool) -> ColumnElement[bool]:
+    """Filter for the rows that come after the key ``values`` in ``_ordering``.
+    
+    A row comparison alone never matches NULL, so a nullable leading column
+    is handled explicitly: NULL-keyed rows form their own run, ordered by the
+    remaining columns, before (descending) or after (ascending) the rest.
+    """
+    key = tuple_(*columns)
+    if not _is_nullable(columns[0]):
+        after = tuple_(*values)
+        return key < after if descending else key > after
+    
+    lead, rest = columns[0], tuple_(*columns[1:])
+    rest_after = tuple_(*values[1:])
+    rest_cmp = rest < rest_after if descending else rest > rest_after
+    
+    if values[0] is None:
+        null_run = and_(lead.is_(None), rest_cmp)
+        return or_(null_run, lead.isnot(None)) if descending else null_run
+    
+    after = tuple_(*values)
+    non_null = and_(lead.isnot(None), key < after if descending else key > after)
+    return non_null if descending else or_(non_null, lead.is_(None))
+
+
+def _sort_key(row: Any, columns: Sequence[Any]) -> tuple:
+    """Read the sort key of a result row (an entity or an entity-first tuple)."""
+    entity = row[0] if isinstance(row, (Row, tuple)) else row
+    return tuple(getattr(entity, column.key) for column in columns)
+
+
+def paginate_keyset(
+    query: Query,
+    columns: Sequence[Any],
+    cursor: str | None = None,
+    limit: int = 20,
+    descending: bool = False,
+) -> tuple[list[T], str | None]:
+    """Paginate a query by a unique sort key without OFFSET.
+    
+    Seeks past the cursor with a row comparison on ``columns`` and fetches one
+    extra row to tell whether another page exists, so the cost of a page does
+    not grow with how deep the client has paged.
+    
+    Args:
+        query: Unordered SQLAlchemy query
+        columns: Sort columns, ending with a unique one (usually ``id``)
+        cursor: Cursor returned with the previous page, if any
+        limit: Maximum number of items to return
+        descending: Sort newest/largest first
+        
+    Returns:
+        Tuple of (items, next_cursor); next_cursor is None on the last page
+        
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    if cursor:
+        query = query.filter(_after(columns, decode_cursor(cursor, columns), descending))
+    
+    rows = query.order_by(*_ordering(columns, descending)).limit(limit + 1).all()
+    
+    if len(rows) <= limit:
+        return rows, None
+    
+    items = rows[:limit]
+    return items, encode_cursor(*_sort_key(items[-1], columns))
+
+
+def paginate_page(
+    query: Query,
+    columns: Sequence[Any],
+    skip: int = 0,
+    cursor: str | None = None,
+    limit: int = 20,
+    descending: bool = False,
+    count: Callable[[], int] | None = None,
+) -> tuple[list[T], int, str | None]:
+    """Paginate by cursor, falling back to OFFSET for clients that send skip.
+    
+    Without a ``count`` callable, the first page (or an OFFSET page) reads the
+    total from a ``count(*) OVER ()`` column fetched with the page, so it
+    costs no extra round-trip. Pages after a cursor cannot, since the cursor
+    filter would narrow the window, and run a separate ``COUNT``. ``query``
+    must not use DISTINCT, which is applied after window functions. OFFSET
+    pages use a deferred join (see ``_offset_page``).
+    
+    Args:
+        query: Unordered SQLAlchemy query
+        columns: Sort columns, ending with a unique one (usually ``id``)
+        skip: Number of items to skip (legacy clients, ignored with a cursor)
+        cursor: Cursor returned with the previous page, if any
+        limit: Maximum number of items to return
+        descending: Sort newest/largest first
+        count: Callable returning the total; defaults to a window count or
+            ``query.count()``
+        
+    Returns:
+        Tuple of (items, total, next_cursor)
+        
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    if skip and not cursor:
+        ordered = query.order_by(*_ordering(columns, descending))
+        items, total = _offset_page(ordered, skip, limit, with_total=count is None)
+        if count:
+            total = count()
+        elif total is None:
+            # An OFFSET past the end returns no rows to read the total from
+            total = query.count()
+        
+        has_more = items and skip + len(items) < total
+        next_cursor = encode_cursor(*_sort_key(items[-1], columns)) if has_more else None
+        return items, total, next_cursor
+    
+    if cursor or count:
+        total = count() if count else query.count()
+        items, next_cursor = paginate_keyset(query, columns, cursor, limit, descending)
+        return items, total, next_cursor
+    
+    # First page: the total is a window column of the page query itself
+    rows, next_cursor = paginate_keyset(
+        query.add_columns(func.count().over().label("_total")),
+        columns,
+        None,
+        limit,
+        descending,
+    )
+    total = rows[0][-1] if rows else 0
+    single = len(query.column_descriptions) == 1
+    items = [row[0] if single else tuple(row[:-1]) for row in rows]
+    return items, total, next_cursor
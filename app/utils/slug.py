@@ -2,6 +2,7 @@ import re
 from datetime import datetime
 
 from slugify import slugify as python_slugify
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
 
 
@@ -105,11 +106,22 @@ def generate_unique_slug(
         Unique slug
     """
     base_slug = generate_slug(text, max_length - 10)  # Reserve space for counter
+    
+    # Fetch every slug the counter loop could collide with in one query
+    taken = set(
+        db.scalars(
+            select(model.slug).where(
+                or_(
+                    model.slug == base_slug,
+                    model.slug.startswith(f"{base_slug}-", autoescape=True),
+                )
+            )
+        )
+    )
+    
     slug = base_slug
     counter = 1
-    
-    # Check if slug exists
-    while db.query(model).filter(model.slug == slug).first():
+    while slug in taken:
         slug = f"{base_slug}-{counter}"
         counter += 1
     
@@ -0,0 +1,5 @@
+import os
+
+# Settings are read at import time; the unit tests never open a connection
+os.environ.setdefault("DATABASE_URL", "postgresql://postgres@localhost/qazaq_test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
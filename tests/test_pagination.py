@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import DateTime, create_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from app.utils.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    paginate_page,
+)
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Post(_Base):
+    __tablename__ = "posts"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    published_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    _Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        # Two rows without a publish time between dated ones
+        session.add_all(
+            [
+                Post(id=1, published_at=BASE_TIME),
+                Post(id=2, published_at=None),
+                Post(id=3, published_at=BASE_TIME + timedelta(days=1)),
+                Post(id=4, published_at=None),
+                Post(id=5, published_at=BASE_TIME + timedelta(days=2)),
+            ]
+        )
+        session.commit()
+        yield session
+
+
+def _walk(db: Session, descending: bool, limit: int = 1) -> list[int]:
+    columns = (Post.published_at, Post.id)
+    items, total, cursor = paginate_page(
+        db.query(Post), columns, limit=limit, descending=descending
+    )
+    seen = [post.id for post in items]
+    while cursor:
+        items, page_total, cursor = paginate_page(
+            db.query(Post), columns, cursor=cursor, limit=limit, descending=descending
+        )
+        assert page_total == total
+        seen.extend(post.id for post in items)
+    assert total == 5
+    return seen
+
+
+@pytest.mark.parametrize("limit", [1, 2])
+def test_cursor_pages_cover_rows_with_null_key_descending(db, limit):
+    # NULLs first when descending, as Postgres orders them
+    assert _walk(db, descending=True, limit=limit) == [4, 2, 5, 3, 1]
+
+
+@pytest.mark.parametrize("limit", [1, 2])
+def test_cursor_pages_cover_rows_with_null_key_ascending(db, limit):
+    assert _walk(db, descending=False, limit=limit) == [1, 3, 5, 2, 4]
+
+
+def test_cursor_round_trips_null_leading_value():
+    cursor = encode_cursor(None, 7)
+    assert decode_cursor(cursor, (Post.published_at, Post.id)) == (None, 7)
+
+
+def test_cursor_rejects_null_for_non_nullable_column():
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor(BASE_TIME, None), (Post.published_at, Post.id))
@@ -0,0 +1,109 @@
+import asyncio
+from io import BytesIO
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from PIL import Image
+from PIL.PngImagePlugin import PngInfo
+from starlette.datastructures import Headers
+
+from app.core.config import settings
+from app.core.storage import storage_service
+
+GPS_IFD = 0x8825
+
+
+def _upload(data: bytes, filename: str, content_type: str) -> UploadFile:
+    return UploadFile(
+        file=BytesIO(data),
+        filename=filename,
+        size=len(data),
+        headers=Headers({"content-type": content_type}),
+    )
+
+
+def _jpeg_with_gps() -> bytes:
+    exif = Image.Exif()
+    exif[0x010F] = "CameraMaker"  # Make
+    exif.get_ifd(GPS_IFD)[2] = (43.0, 15.0, 0.0)  # GPSLatitude
+    buf = BytesIO()
+    Image.new("RGB", (40, 30), "red").save(buf, format="JPEG", exif=exif)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def local_storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(storage_service, "storage_type", "local")
+    return tmp_path
+
+
+def test_small_jpeg_with_exif_is_stored_without_it(local_storage):
+    data = _jpeg_with_gps()
+    assert Image.open(BytesIO(data)).getexif()
+
+    _, file_path, file_size = asyncio.run(
+        storage_service.save_upload(_upload(data, "photo.jpg", "image/jpeg"))
+    )
+
+    stored = Image.open(file_path)
+    assert not stored.getexif()
+    assert "exif" not in stored.info
+    assert file_size == len(open(file_path, "rb").read())
+
+
+def test_small_webp_with_exif_is_stored_without_it(local_storage):
+    buf = BytesIO()
+    exif = Image.Exif()
+    exif[0x010F] = "CameraMaker"
+    Image.new("RGB", (40, 30), "red").save(buf, format="WEBP", exif=exif)
+
+    _, file_path, _ = asyncio.run(
+        storage_service.save_upload(_upload(buf.getvalue(), "a.webp", "image/webp"))
+    )
+
+    assert not Image.open(file_path).getexif()
+
+
+def test_small_png_text_chunks_are_stripped(local_storage):
+    info = PngInfo()
+    info.add_text("Author", "someone")
+    buf = BytesIO()
+    Image.new("RGB", (40, 30), "red").save(buf, format="PNG", pnginfo=info)
+
+    _, file_path, _ = asyncio.run(
+        storage_service.save_upload(_upload(buf.getvalue(), "a.png", "image/png"))
+    )
+
+    assert "Author" not in Image.open(file_path).info
+
+
+def test_small_image_without_metadata_is_stored_as_uploaded(local_storage):
+    buf = BytesIO()
+    Image.new("RGB", (40, 30), "red").save(buf, format="PNG")
+    data = buf.getvalue()
+
+    _, file_path, file_size = asyncio.run(
+        storage_service.save_upload(_upload(data, "a.png", "image/png"))
+    )
+
+    assert open(file_path, "rb").read() == data
+    assert file_size == len(data)
+
+
+@pytest.mark.parametrize(
+    ("fmt", "filename", "content_type"),
+    [("PNG", "a.png", "image/png"), ("JPEG", "a.jpg", "image/jpeg")],
+)
+def test_small_truncated_image_is_rejected(local_storage, fmt, filename, content_type):
+    buf = BytesIO()
+    Image.effect_noise((40, 30), 64).save(buf, format=fmt)
+    data = buf.getvalue()[: len(buf.getvalue()) // 2]
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(
+            storage_service.save_upload(_upload(data, filename, content_type))
+        )
+
+    assert exc_info.value.status_code == 400
+    assert not list(local_storage.iterdir())